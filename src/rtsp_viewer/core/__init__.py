@@ -1,18 +1,38 @@
 """Core modules for RTSP Viewer."""
 
-from rtsp_viewer.core.config import CameraConfig, load_cameras
-from rtsp_viewer.core.unified_stream import UnifiedStream, StreamStats
-from rtsp_viewer.core.viewer import RTSPViewer
-from rtsp_viewer.core.streamer import RTSPStreamer
-from rtsp_viewer.core.gst_streamer import GstRTSPStreamer, LoopingGstRTSPStreamer
+import importlib
 
-__all__ = [
-    "CameraConfig",
-    "load_cameras",
-    "UnifiedStream",
-    "StreamStats",
-    "RTSPViewer",
-    "RTSPStreamer",
-    "GstRTSPStreamer",
-    "LoopingGstRTSPStreamer",
-]
+# Attribute -> defining submodule, resolved lazily via PEP 562 below.
+# Importing the package no longer drags in cv2/numpy and the streamer
+# stacks until a symbol that needs them is first touched, which cuts
+# cold-start time and resident memory for config-only consumers.
+_LAZY_ATTRS = {
+    "CameraConfig": "rtsp_viewer.core.config",
+    "load_cameras": "rtsp_viewer.core.config",
+    "UnifiedStream": "rtsp_viewer.core.unified_stream",
+    "StreamStats": "rtsp_viewer.core.unified_stream",
+    "FFmpegPipeStream": "rtsp_viewer.core.pipe_stream",
+    "RTSPViewer": "rtsp_viewer.core.viewer",
+    "RTSPStreamer": "rtsp_viewer.core.streamer",
+    "GstRTSPStreamer": "rtsp_viewer.core.gst_streamer",
+    "LoopingGstRTSPStreamer": "rtsp_viewer.core.gst_streamer",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so subsequent lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,815 @@
+"""FFmpeg pipe capture backend - raw frames decoded out-of-process."""
+
+import mmap
+import os
+import re
+import selectors
+import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from rtsp_viewer.core.config import CameraConfig
+from rtsp_viewer.core.unified_stream import StreamStats
+from rtsp_viewer.utils.logger import get_logger
+
+log = get_logger("pipe_stream")
+
+# hwaccel methods this backend knows how to request, in preference order
+# for decoder="auto"
+_HWACCEL_PREFERENCE = ("cuda", "vaapi", "videotoolbox")
+
+_hwaccel_lock = threading.Lock()
+_hwaccels_available: frozenset[str] | None = None
+
+# ffmpeg's stream banner, e.g.
+#   Stream #0:0: Video: h264 (Main), yuv420p, 1920x1080, 30 fps, ...
+# The format is stable across releases; parsing it from the capture
+# process's own stderr saves a whole ffprobe RTSP session at startup.
+_STREAM_INFO_RE = re.compile(
+    r"Video:\s*(\w+).*?(\d+)x(\d+).*?(\d+(?:\.\d+)?)\s*fps"
+)
+
+
+def _probe_hwaccels() -> frozenset[str]:
+    """Return the hwaccel methods this host's ffmpeg supports.
+
+    Spawning ffmpeg just to ask costs tens of milliseconds, so the answer
+    is probed once per process and cached.
+    """
+    global _hwaccels_available
+    with _hwaccel_lock:
+        if _hwaccels_available is None:
+            try:
+                result = subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-hwaccels"],
+                    capture_output=True, text=True, timeout=10,
+                )
+                _hwaccels_available = frozenset(
+                    line.strip()
+                    for line in result.stdout.splitlines()[1:]
+                    if line.strip()
+                )
+            except (subprocess.TimeoutExpired, OSError):
+                _hwaccels_available = frozenset()
+        return _hwaccels_available
+
+
+class _CallbackWorker:
+    """Deliver frames to one callback on its own thread.
+
+    A single-slot drop-oldest queue decouples the consumer from the
+    capture thread: publish() is an append plus an Event set, so a slow
+    consumer (GUI redraw, inference) can never stall acquisition — it
+    just sees the newest frame when it catches up, matching the
+    latest-wins semantics of UnifiedStream's dispatcher.
+    """
+
+    def __init__(self, callback: Callable[[np.ndarray], None]):
+        self.callback = callback
+        self._queue: deque[np.ndarray] = deque(maxlen=1)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="pipe-callback"
+        )
+        self._thread.start()
+
+    def publish(self, frame: np.ndarray) -> None:
+        """Hand the worker a frame; never blocks."""
+        self._queue.append(frame)
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Stop the worker thread."""
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=1)
+
+    def _run(self) -> None:
+        queue = self._queue
+        wake = self._wake
+        stop = self._stop
+        while not stop.is_set():
+            wake.wait()
+            wake.clear()
+            while queue and not stop.is_set():
+                try:
+                    frame = queue.popleft()
+                except IndexError:
+                    break
+                try:
+                    self.callback(frame)
+                except Exception as e:
+                    log.error(f"Frame callback error: {e}")
+
+
+class FFmpegPipeStream:
+    """Capture decoded frames from an ffmpeg child process over a pipe.
+
+    Alternative capture backend to UnifiedStream's in-process decoding:
+    ffmpeg decodes in its own process and writes raw BGR24 frames to
+    stdout, so H.264/H.265 decode never competes with the GUI for this
+    interpreter's GIL. The cost is one pipe copy per frame, which is why
+    the read path reuses preallocated buffers via readinto() instead of
+    allocating a fresh bytes object per frame (~6 MB/frame at 1080p).
+
+    The public surface mirrors UnifiedStream where the concepts overlap:
+    start/stop, get_frame, add_frame_callback, and a shared StreamStats.
+    """
+
+    RECONNECT_DELAY = 5.0
+    FRAME_TIMEOUT = 10.0
+    RING_SLOTS = 3
+
+    def __init__(
+        self,
+        camera: CameraConfig,
+        decoder: str = "auto",
+        output_dir: str = "recordings",
+        share_frames: bool = False,
+        pixel_format: str = "bgr24",
+    ):
+        self.camera = camera
+        self.output_dir = Path(output_dir)
+
+        # nv12 halves the pipe traffic (1.5 B/px vs 3 B/px) for consumers
+        # that can take YUV directly; frames are then published as a
+        # (h*3//2, w) uint8 array — Y plane on top, interleaved UV below
+        if pixel_format not in ("bgr24", "nv12"):
+            raise ValueError(f"Unsupported pixel_format: {pixel_format}")
+        self._pixel_format = pixel_format
+
+        if decoder != "cpu" and decoder not in ("auto", *_HWACCEL_PREFERENCE):
+            raise ValueError(f"Unsupported decoder: {decoder}")
+        self._decoder = decoder
+
+        self._process: subprocess.Popen | None = None
+        self._raw_fd: int | None = None
+        self._capture_thread: threading.Thread | None = None
+        self._stderr_thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        # Self-pipe: stop() writes a byte so a read blocked in select()
+        # returns immediately instead of waiting out the frame timeout
+        self._stop_pipe_r: int | None = None
+        self._stop_pipe_w: int | None = None
+
+        # SPSC ring of preallocated frame slots. The capture thread fills
+        # slot head % N and then bumps head; readers take (head - 1) % N.
+        # head is a plain int — single-writer increments and reader loads
+        # are each one bytecode under the GIL, so no lock is needed.
+        self._ring: list[np.ndarray] | None = None
+        self._ring_views: list[memoryview] | None = None
+        self._ring_maps: list[mmap.mmap] | None = None
+        self._head = 0
+
+        # Alternating conversion targets for get_frame_bgr in nv12 mode
+        self._bgr_bufs: list[np.ndarray] | None = None
+        self._bgr_idx = 0
+
+        # (head, UMat) of the last frame uploaded by get_frame_umat
+        self._umat_cache: tuple[int, cv2.UMat] | None = None
+
+        # Opt-in: put the whole ring in named shared memory so another
+        # process can consume frames without touching this interpreter
+        self._share_frames = share_frames
+        self._shm: shared_memory.SharedMemory | None = None
+        self._shm_header: np.ndarray | None = None
+
+        self._workers: list[_CallbackWorker] = []
+
+        # Recording shares the capture ffmpeg: the child grows a second
+        # stream-copy MP4 output instead of opening another RTSP session
+        self._recording_file: Path | None = None
+        self._record_audio = True
+        self._restart_requested = threading.Event()
+
+        self._stats = StreamStats()
+        self._info_event = threading.Event()
+        self._status_callback: Callable[[str], None] | None = None
+
+    # --- Callbacks ---
+
+    def set_status_callback(self, callback: Callable[[str], None] | None) -> None:
+        """Set status update callback."""
+        self._status_callback = callback
+
+    def _notify_status(self, status: str) -> None:
+        """Notify status callback."""
+        if self._status_callback:
+            try:
+                self._status_callback(status)
+            except Exception as e:
+                log.error(f"Status callback error: {e}")
+
+    def add_frame_callback(self, callback: Callable[[np.ndarray], None]) -> None:
+        """Add frame callback; it runs on its own delivery thread."""
+        self._workers.append(_CallbackWorker(callback))
+
+    def remove_frame_callback(self, callback: Callable[[np.ndarray], None]) -> None:
+        """Remove frame callback."""
+        for worker in self._workers:
+            if worker.callback == callback:
+                self._workers.remove(worker)
+                worker.stop()
+                break
+
+    # --- Stream setup ---
+
+    def _select_hwaccel(self) -> str | None:
+        """Pick the hwaccel to request, honouring the decoder setting."""
+        if self._decoder == "cpu":
+            return None
+        available = _probe_hwaccels()
+        if self._decoder != "auto":
+            if self._decoder in available:
+                return self._decoder
+            log.warning(
+                f"Requested decoder '{self._decoder}' not supported by "
+                "this ffmpeg, decoding in software"
+            )
+            return None
+        for method in _HWACCEL_PREFERENCE:
+            if method in available:
+                return method
+        return None
+
+    def _build_command(self) -> list[str]:
+        """Build the ffmpeg capture command (rawvideo BGR24 on stdout)."""
+        # -loglevel info so the stream banner (parsed for geometry by
+        # _drain_stderr) is printed
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel", "info",
+        ]
+        hwaccel = self._select_hwaccel()
+        if hwaccel is not None:
+            # Decode on the GPU; frames still come back as system-memory
+            # BGR24 because every downstream consumer expects that layout
+            cmd += ["-hwaccel", hwaccel]
+            log.debug(f"Using {hwaccel} hardware decoding")
+        if self.camera.low_latency:
+            # Don't pre-buffer or probe: first frame out as fast as
+            # possible, and no demuxer reordering queue adding jitter.
+            # Mirrors the option set the OpenCV backend passes through
+            # OPENCV_FFMPEG_CAPTURE_OPTIONS.
+            cmd += [
+                "-fflags", "nobuffer+genpts+discardcorrupt",
+                "-flags", "low_delay",
+                "-probesize", "32",
+                "-analyzeduration", "0",
+                "-max_delay", "0",
+                "-reorder_queue_size", "0",
+            ]
+        else:
+            cmd += ["-fflags", "+genpts+discardcorrupt"]
+        cmd += [
+            "-rtsp_transport", "tcp",
+            "-i", self.camera.rtsp_url,
+            "-map", "0:v:0",
+            "-f", "rawvideo",
+            "-pix_fmt", self._pixel_format,
+            "pipe:1",
+        ]
+        if self._recording_file is not None:
+            # Second output off the same RTSP session: video is stream-
+            # copied (no re-encode), audio transcoded to AAC when wanted
+            cmd += ["-map", "0:v:0"]
+            if self._record_audio:
+                cmd += ["-map", "0:a?", "-c:a", "aac", "-b:a", "128k"]
+            else:
+                cmd += ["-an"]
+            cmd += [
+                "-c:v", "copy",
+                "-movflags", "+frag_keyframe+empty_moov+default_base_moof",
+                str(self._recording_file),
+            ]
+        return cmd
+
+    def _start_process(self) -> bool:
+        """Spawn the capture ffmpeg."""
+        try:
+            # bufsize=0 keeps stdout an unbuffered FileIO: readinto()
+            # lands pipe data straight in the ring slot instead of going
+            # through BufferedReader's intermediate 8 KB buffer
+            self._process = subprocess.Popen(
+                self._build_command(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+            )
+        except OSError as e:
+            log.error(f"Failed to start ffmpeg: {e}")
+            return False
+
+        self._raw_fd = self._process.stdout.fileno()
+        self._stderr_thread = threading.Thread(
+            target=self._drain_stderr, daemon=True, name="pipe-stderr"
+        )
+        self._stderr_thread.start()
+        return True
+
+    def _drain_stderr(self) -> None:
+        """Drain ffmpeg stderr so the child never blocks on a full pipe.
+
+        Reads 64 KB chunks with os.read rather than iterating lines —
+        ffmpeg emits many short status lines and readline() costs a
+        Python call per line, enough to matter on small hosts. Until
+        stream info is known the accumulated text is scanned for the
+        stream banner (which fills in the stats and wakes start());
+        afterwards only a bounded tail is kept and logged at exit for
+        error diagnosis.
+        """
+        process = self._process
+        if process is None or process.stderr is None:
+            return
+        fd = process.stderr.fileno()
+        buf = bytearray()
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                break
+            if not chunk:
+                break
+            buf += chunk
+            if not self._info_event.is_set():
+                match = _STREAM_INFO_RE.search(buf.decode("utf-8", "replace"))
+                if match:
+                    self._stats.codec = match.group(1)
+                    self._stats.width = int(match.group(2))
+                    self._stats.height = int(match.group(3))
+                    self._stats.fps = float(match.group(4))
+                    self._info_event.set()
+            if len(buf) > 1 << 20:
+                del buf[: len(buf) - (1 << 19)]
+        tail = buf.decode("utf-8", "replace").strip()
+        if tail:
+            log.debug(f"ffmpeg stderr tail:\n{tail[-2000:]}")
+
+    # --- Lifecycle ---
+
+    def start(self) -> bool:
+        """Start capturing frames."""
+        if self._capture_thread is not None:
+            log.warning("Pipe stream already started")
+            return False
+
+        self._info_event.clear()
+        if not self._start_process():
+            self._notify_status("Failed to start ffmpeg")
+            return False
+
+        # Stream geometry comes from the capture process's own stderr
+        # banner — no separate ffprobe RTSP session needed
+        if not self._info_event.wait(timeout=15):
+            log.error("Timed out waiting for stream info from ffmpeg")
+            self._notify_status("Failed to probe stream")
+            self.stop()
+            return False
+
+        # Ring slots live in anonymous mmaps rather than np.empty: the
+        # pages are guaranteed page-aligned, which keeps the kernel on its
+        # fast path for the pipe->userspace copy, and madvise hints the
+        # sequential fill pattern. madvise is not available everywhere,
+        # so the hints are best-effort.
+        h, w = self._stats.height, self._stats.width
+        if self._pixel_format == "nv12":
+            frame_size = w * h * 3 // 2
+            shape: tuple[int, ...] = (h * 3 // 2, w)
+        else:
+            frame_size = h * w * 3
+            shape = (h, w, 3)
+        if self._share_frames:
+            self._setup_shared_ring(shape, frame_size)
+        if self._ring is None:
+            self._allocate_ring(shape, frame_size)
+        self._ring_views = [memoryview(slot).cast("B") for slot in self._ring]
+        self._head = 0
+
+        self._stop_event.clear()
+        self._stop_pipe_r, self._stop_pipe_w = os.pipe()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, daemon=True, name="pipe-capture"
+        )
+        self._capture_thread.start()
+
+        log.info(
+            f"Pipe stream started: {self._stats.width}x{self._stats.height} "
+            f"@ {self._stats.fps:.1f}fps ({self._stats.codec})"
+        )
+        return True
+
+    def _allocate_ring(self, shape: tuple[int, ...], frame_size: int) -> None:
+        """Allocate the private mmap-backed frame ring."""
+        self._ring_maps = []
+        self._ring = []
+        for _ in range(self.RING_SLOTS):
+            buf = mmap.mmap(-1, frame_size)
+            for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                try:
+                    buf.madvise(getattr(mmap, advice))
+                except (AttributeError, OSError):
+                    pass
+            self._ring_maps.append(buf)
+            self._ring.append(np.ndarray(shape, np.uint8, buffer=buf))
+
+    def _setup_shared_ring(self, shape: tuple[int, ...], frame_size: int) -> None:
+        """Build the frame ring inside a named shared-memory segment.
+
+        Layout: one page of int64 header [head, width, height, slots,
+        frame_size] followed by RING_SLOTS page-aligned frame slots. An
+        external process attaches by camera name, reads the header, and
+        follows head with the same latest-wins rules as get_frame() — no
+        queue, no locking, and frames never cross the GIL:
+
+            shm = SharedMemory(name=f"rtsp_pipe_{safe_camera_name}")
+            header = np.ndarray(5, np.int64, buffer=shm.buf)
+
+        Falls back to the private ring when shared memory is unavailable.
+        """
+        h, w = self._stats.height, self._stats.width
+        header_size = mmap.PAGESIZE
+        slot_stride = -(-frame_size // mmap.PAGESIZE) * mmap.PAGESIZE
+        size = header_size + slot_stride * self.RING_SLOTS
+        safe_name = "".join(
+            c if c.isalnum() or c in "-_" else "_" for c in self.camera.name
+        )
+        name = f"rtsp_pipe_{safe_name}"
+        try:
+            try:
+                self._shm = shared_memory.SharedMemory(create=True, size=size, name=name)
+            except FileExistsError:
+                # Stale segment from a previous run; attach and reuse
+                self._shm = shared_memory.SharedMemory(name=name)
+            buf = self._shm.buf
+            self._shm_header = np.ndarray(5, np.int64, buffer=buf)
+            self._shm_header[:] = (0, w, h, self.RING_SLOTS, frame_size)
+            self._ring = [
+                np.ndarray(
+                    shape,
+                    np.uint8,
+                    buffer=buf[header_size + i * slot_stride:],
+                )
+                for i in range(self.RING_SLOTS)
+            ]
+            log.info(f"Sharing frame ring via shared memory: {name} ({size} bytes)")
+        except Exception as e:
+            log.warning(f"Shared-memory publishing unavailable: {e}")
+            self._teardown_shared_ring()
+
+    def _teardown_shared_ring(self) -> None:
+        """Release the shared-memory segment, if any."""
+        if self._shm is None:
+            return
+        self._shm_header = None
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except Exception:
+            pass
+        self._shm = None
+
+    def stop(self) -> None:
+        """Stop capturing and terminate ffmpeg."""
+        self._stop_event.set()
+        if self._stop_pipe_w is not None:
+            try:
+                os.write(self._stop_pipe_w, b"\x00")
+            except OSError:
+                pass
+
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=3)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+            self._raw_fd = None
+
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=2)
+            self._capture_thread = None
+
+        for worker in self._workers:
+            worker.stop()
+        self._workers.clear()
+
+        if self._stop_pipe_r is not None:
+            os.close(self._stop_pipe_r)
+            os.close(self._stop_pipe_w)
+            self._stop_pipe_r = None
+            self._stop_pipe_w = None
+
+        self._stats.is_connected = False
+        self._head = 0
+        self._ring = None
+        self._ring_views = None
+        self._umat_cache = None
+        if self._ring_maps is not None:
+            for buf in self._ring_maps:
+                try:
+                    buf.close()
+                except BufferError:
+                    # A consumer still holds a frame view; the map is
+                    # freed when that reference goes away
+                    pass
+            self._ring_maps = None
+        self._teardown_shared_ring()
+        log.info("Pipe stream stopped")
+
+    # --- Capture ---
+
+    def _read_frame(self, view: memoryview, sel: selectors.BaseSelector) -> bool:
+        """Fill view with exactly one raw frame from the ffmpeg pipe.
+
+        Reads on the raw pipe fd with os.readv straight into the ring
+        slot's memoryview: one read(2) per chunk with no file-object
+        indirection and no heap allocation (os.read would hand back a
+        fresh bytes object per chunk). Every read waits on the selector
+        first, so a wedged ffmpeg trips FRAME_TIMEOUT and reconnects
+        instead of blocking forever, and stop()'s self-pipe byte aborts a
+        read already in progress. Short reads mean EOF or a dying child;
+        both return False.
+        """
+        fd = self._raw_fd
+        stop_fd = self._stop_pipe_r
+        if fd is None:
+            return False
+        offset = 0
+        size = len(view)
+        readv = os.readv
+        frame_timeout = self.FRAME_TIMEOUT
+        try:
+            while offset < size:
+                ready = sel.select(frame_timeout)
+                if not ready:
+                    log.warning("Timed out waiting for frame data")
+                    return False
+                if any(key.fd == stop_fd for key, _ in ready):
+                    return False
+                n = readv(fd, (view[offset:],))
+                if n <= 0:
+                    return False
+                offset += n
+        except OSError:
+            # fd torn down under us by stop()/reconnect
+            return False
+        return True
+
+    def _capture_loop(self) -> None:
+        """Outer capture loop: (re)connect and run a specialized inner loop.
+
+        The steady-state read/publish loop is compiled per connection by
+        _make_connection_loop with every hot binding closed over as a
+        local, so it does no attribute lookups per frame; this outer loop
+        only handles connection turnover.
+        """
+        sel: selectors.BaseSelector | None = None
+        sel_fd: int | None = None
+
+        self._stats.is_connected = True
+
+        while not self._stop_event.is_set():
+            process = self._process
+            if process is None or process.poll() is not None:
+                self._stats.is_connected = False
+                if not self._reconnect():
+                    break
+                continue
+
+            # (Re)build the selector whenever reconnect swaps the pipe fd
+            fd = self._raw_fd
+            if sel is None or sel_fd != fd:
+                if sel is not None:
+                    sel.close()
+                sel = selectors.DefaultSelector()
+                sel.register(fd, selectors.EVENT_READ)
+                if self._stop_pipe_r is not None:
+                    sel.register(self._stop_pipe_r, selectors.EVENT_READ)
+                sel_fd = fd
+
+            # Runs until stop, restart, or a failed read
+            self._make_connection_loop(sel)()
+
+            if self._stop_event.is_set():
+                break
+            if not self._restart_requested.is_set():
+                self._stats.frames_dropped += 1
+                self._stats.is_connected = False
+                log.warning("Short read from ffmpeg, reconnecting...")
+                self._notify_status("Stream interrupted - reconnecting...")
+            if not self._reconnect():
+                break
+
+        if sel is not None:
+            sel.close()
+        self._stats.is_connected = False
+        log.debug("Pipe capture loop ended")
+
+    def _make_connection_loop(self, sel: selectors.BaseSelector) -> Callable[[], None]:
+        """Build the per-connection read/publish loop.
+
+        Ring, selector, stats, worker list, and clock are all constant
+        for the lifetime of one ffmpeg child, so they are closed over
+        here once instead of being re-resolved through self on every
+        frame (~100 ns per attribute lookup adds up at 60 FPS). The
+        worker list object is stable — add/remove mutate it in place —
+        so closing over it still sees membership changes.
+        """
+        ring = self._ring
+        ring_views = self._ring_views
+        ring_slots = self.RING_SLOTS
+        shm_header = self._shm_header
+        stats = self._stats
+        workers = self._workers
+        stop_is_set = self._stop_event.is_set
+        read_frame = self._read_frame
+        process = self._process
+        # Monotonic integer clock: immune to wall-clock steps and cheaper
+        # than float arithmetic per frame, same as the UnifiedStream loops
+        _now_ns = time.monotonic_ns
+
+        def run() -> None:
+            fps_start = _now_ns()
+            frame_count = 0
+            head = self._head
+            while not stop_is_set() and process is self._process:
+                slot = head % ring_slots
+                if not read_frame(ring_views[slot], sel):
+                    return
+
+                frame = ring[slot]
+                head += 1
+                self._head = head
+                if shm_header is not None:
+                    # External readers follow head through the header page
+                    shm_header[0] = head
+
+                # Fan out to per-consumer workers; publish never blocks,
+                # so a slow consumer can't stall acquisition
+                for worker in workers:
+                    worker.publish(frame)
+
+                frame_count += 1
+                current_time = _now_ns()
+                elapsed_ns = current_time - fps_start
+                if elapsed_ns >= 1_000_000_000:
+                    stats.fps = frame_count * 1_000_000_000 / elapsed_ns
+                    stats.frames_received += frame_count
+                    frame_count = 0
+                    fps_start = current_time
+
+        return run
+
+    def _reconnect(self) -> bool:
+        """Restart the ffmpeg child after a failure."""
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+            self._raw_fd = None
+
+        # A deliberate restart (recording toggled) skips the failure
+        # backoff; the stream was healthy a moment ago
+        if self._restart_requested.is_set():
+            self._restart_requested.clear()
+        elif self._stop_event.wait(self.RECONNECT_DELAY):
+            return False
+
+        log.info("Restarting ffmpeg capture...")
+        if not self._start_process():
+            return False
+        self._stats.is_connected = True
+        return True
+
+    # --- Recording ---
+
+    def start_recording(self, record_audio: bool = True) -> bool:
+        """Start recording by adding an MP4 output to the capture ffmpeg.
+
+        The child is restarted with a second stream-copy output, so
+        recording costs no extra RTSP session, no second decode, and no
+        re-encode — just the remux to fragmented MP4.
+        """
+        if self._recording_file is not None:
+            log.warning("Already recording")
+            return False
+        if self._process is None:
+            log.warning("Cannot record: stream not started")
+            return False
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        safe_name = "".join(
+            c if c.isalnum() or c in "-_" else "_" for c in self.camera.name
+        )
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._recording_file = self.output_dir / f"{safe_name}_{timestamp}.mp4"
+        self._record_audio = record_audio
+        self._request_restart()
+        self._stats.is_recording = True
+        log.info(f"Recording to {self._recording_file}")
+        return True
+
+    def stop_recording(self) -> Path | None:
+        """Stop recording; the capture output keeps running."""
+        if self._recording_file is None:
+            return None
+        recorded = self._recording_file
+        self._recording_file = None
+        self._stats.is_recording = False
+        self._request_restart()
+        log.info(f"Recording stopped: {recorded}")
+        return recorded
+
+    def _request_restart(self) -> None:
+        """Make the capture loop restart ffmpeg with the current outputs."""
+        self._restart_requested.set()
+        if self._process is not None:
+            self._process.terminate()
+
+    def is_recording(self) -> bool:
+        """Check if recording."""
+        return self._recording_file is not None
+
+    # --- Frame access ---
+
+    def get_frame(self) -> np.ndarray | None:
+        """Get the latest frame without locking or copying.
+
+        Returns a view into a ring slot that the capture thread will reuse
+        RING_SLOTS - 1 frames later; treat it as read-only and copy it if
+        it must outlive the next couple of frames.
+        """
+        head = self._head
+        ring = self._ring
+        if head == 0 or ring is None:
+            return None
+        return ring[(head - 1) % self.RING_SLOTS]
+
+    def get_frame_bgr(self) -> np.ndarray | None:
+        """Get the latest frame as BGR, converting from NV12 if needed.
+
+        In bgr24 mode this is get_frame(). In nv12 mode the frame runs
+        through OpenCV's SIMD cvtColor into one of two alternating
+        preallocated buffers (the get_frame_copy pattern from
+        UnifiedStream), so per-call allocation is zero and the buffer
+        handed to the previous caller survives one more call.
+        """
+        frame = self.get_frame()
+        if frame is None or self._pixel_format == "bgr24":
+            return frame
+        h = frame.shape[0] * 2 // 3
+        w = frame.shape[1]
+        bufs = self._bgr_bufs
+        if bufs is None or bufs[0].shape != (h, w, 3):
+            bufs = [
+                np.empty((h, w, 3), np.uint8),
+                np.empty((h, w, 3), np.uint8),
+            ]
+            self._bgr_bufs = bufs
+        buf = bufs[self._bgr_idx]
+        self._bgr_idx ^= 1
+        cv2.cvtColor(frame, cv2.COLOR_YUV2BGR_NV12, dst=buf)
+        return buf
+
+    def get_frame_umat(self) -> cv2.UMat | None:
+        """Get the latest frame as a cv2.UMat for T-API processing.
+
+        OpenCV ops on a UMat (cvtColor, resize, putText overlays) run
+        through the transparent OpenCL path where the platform has one,
+        so a consumer chaining several image ops keeps the intermediate
+        ~6 MB surfaces off the CPU and only pays a readback for the
+        final display copy. The upload happens once per published frame;
+        repeat calls for the same frame return the cached UMat.
+        """
+        head = self._head
+        ring = self._ring
+        if head == 0 or ring is None:
+            return None
+        cached = self._umat_cache
+        if cached is not None and cached[0] == head:
+            return cached[1]
+        umat = cv2.UMat(ring[(head - 1) % self.RING_SLOTS])
+        self._umat_cache = (head, umat)
+        return umat
+
+    @property
+    def stats(self) -> StreamStats:
+        """Get stream statistics."""
+        return self._stats
+
+    @property
+    def is_streaming(self) -> bool:
+        """Check if streaming."""
+        return self._capture_thread is not None and self._capture_thread.is_alive()
@@ -4,6 +4,7 @@ import shutil
 import subprocess
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -16,6 +17,43 @@ log = get_logger("recorder")
 DEFAULT_SEGMENT_DURATION = 30 * 60
 
 
+def build_recording_command(
+    rtsp_url: str, output_file: Path, record_audio: bool = True
+) -> list[str]:
+    """Build the ffmpeg command used for stream-copy recording.
+
+    Shared by Recorder and UnifiedStream so the copy/fragmentation flags
+    cannot drift between the two recording paths.
+    """
+    cmd = [
+        "ffmpeg",
+        "-y",  # Overwrite output file
+        "-use_wallclock_as_timestamps", "1",  # Use system clock for timestamps
+        "-fflags", "+genpts+discardcorrupt",  # Generate PTS and discard corrupt frames
+        "-rtsp_transport", "tcp",  # Use TCP transport
+        "-buffer_size", "8192000",  # 8MB buffer for high-bitrate 2K streams
+        "-probesize", "10000000",  # 10MB probe size for faster stream analysis
+        "-analyzeduration", "10000000",  # 10 seconds analysis duration
+        "-i", rtsp_url,
+        "-c:v", "copy",  # Copy video without re-encoding
+        "-reset_timestamps", "1",  # Reset timestamps at start
+    ]
+
+    if record_audio:
+        # Re-encode audio to AAC (pcm_alaw/mulaw from some cameras isn't MP4 compatible)
+        cmd.extend(["-c:a", "aac", "-b:a", "128k"])
+    else:
+        # No audio
+        cmd.extend(["-an"])
+
+    cmd.extend([
+        "-movflags", "+frag_keyframe+empty_moov+default_base_moof",  # Fragmented MP4 - writes moov at start, survives crashes
+        str(output_file),
+    ])
+
+    return cmd
+
+
 class Recorder:
     """Records RTSP streams using ffmpeg at the highest available quality."""
 
@@ -98,33 +136,9 @@ class Recorder:
 
     def _build_ffmpeg_command(self, output_file: Path) -> list[str]:
         """Build the ffmpeg command for recording."""
-        cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output file
-            "-use_wallclock_as_timestamps", "1",  # Use system clock for timestamps
-            "-fflags", "+genpts+discardcorrupt",  # Generate PTS and discard corrupt frames
-            "-rtsp_transport", "tcp",  # Use TCP transport
-            "-buffer_size", "8192000",  # 8MB buffer for high-bitrate 2K streams
-            "-probesize", "10000000",  # 10MB probe size for faster stream analysis
-            "-analyzeduration", "10000000",  # 10 seconds analysis duration
-            "-i", self.camera.rtsp_url,
-            "-c:v", "copy",  # Copy video without re-encoding
-            "-reset_timestamps", "1",  # Reset timestamps at start
-        ]
-
-        if self._record_audio:
-            # Re-encode audio to AAC (pcm_alaw/mulaw from some cameras isn't MP4 compatible)
-            cmd.extend(["-c:a", "aac", "-b:a", "128k"])
-        else:
-            # No audio
-            cmd.extend(["-an"])
-
-        cmd.extend([
-            "-movflags", "+frag_keyframe+empty_moov+default_base_moof",  # Fragmented MP4 - writes moov at start, survives crashes
-            str(output_file),
-        ])
-
-        return cmd
+        return build_recording_command(
+            self.camera.rtsp_url, output_file, self._record_audio
+        )
 
     def _recording_loop(self) -> None:
         """Run ffmpeg for recording with segment rotation."""
@@ -352,7 +366,57 @@ class Recorder:
 
 
 class StreamProbe:
-    """Probe RTSP stream to get detailed information."""
+    """Probe RTSP stream to get detailed information.
+
+    ffprobe takes seconds per stream, so besides the blocking
+    get_stream_info there is an async variant backed by a small shared
+    thread pool with a per-URL TTL cache: browsing a camera list probes
+    each stream once, in parallel, without ever blocking the UI thread.
+    """
+
+    CACHE_TTL = 60.0
+
+    _lock = threading.Lock()
+    _executor: ThreadPoolExecutor | None = None
+    _cache: dict[str, tuple[float, dict]] = {}
+    _pending: dict[str, Future] = {}
+
+    @classmethod
+    def get_stream_info_async(cls, rtsp_url: str) -> Future:
+        """Probe a stream on the shared pool; returns a Future[dict].
+
+        A fresh cache entry resolves immediately, and concurrent
+        requests for the same URL share one in-flight probe.
+        """
+        now = time.monotonic()
+        with cls._lock:
+            cached = cls._cache.get(rtsp_url)
+            if cached is not None and now - cached[0] < cls.CACHE_TTL:
+                future: Future = Future()
+                future.set_result(cached[1])
+                return future
+
+            pending = cls._pending.get(rtsp_url)
+            if pending is not None:
+                return pending
+
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="stream-probe"
+                )
+            future = cls._executor.submit(cls._probe_and_cache, rtsp_url)
+            cls._pending[rtsp_url] = future
+            return future
+
+    @classmethod
+    def _probe_and_cache(cls, rtsp_url: str) -> dict:
+        """Run the blocking probe and record the result."""
+        info = cls.get_stream_info(rtsp_url)
+        with cls._lock:
+            if info:
+                cls._cache[rtsp_url] = (time.monotonic(), info)
+            cls._pending.pop(rtsp_url, None)
+        return info
 
     @staticmethod
     def get_stream_info(rtsp_url: str) -> dict:
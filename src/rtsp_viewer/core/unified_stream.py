@@ -4,19 +4,69 @@ import os
 import subprocess
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from multiprocessing import shared_memory
 from pathlib import Path
 
 import cv2
 import numpy as np
 
 from rtsp_viewer.core.config import CameraConfig
+from rtsp_viewer.core.recorder import build_recording_command
 from rtsp_viewer.utils.logger import get_logger
 
 log = get_logger("unified_stream")
 
+# PyAV backend is optional: it decodes in libav worker threads and does the
+# colorspace conversion inside swscale, skipping OpenCV's extra BGR copy
+try:
+    import av as _av
+except ImportError:
+    _av = None
+
+# OpenCV has no per-capture API for FFmpeg demuxer options; it reads
+# OPENCV_FFMPEG_CAPTURE_OPTIONS once per VideoCapture construction.
+# Serialize env setup + construction and restore the previous value so
+# concurrent opens can't inherit each other's options and nothing leaks
+# into the process environment afterwards.
+_capture_open_lock = threading.Lock()
+
+# FFmpeg demuxer options are constant per mode; built once here instead of
+# being reassembled on every (re)connect
+_FFMPEG_OPTS_LOW_LATENCY = (
+    "rtsp_transport;tcp|"
+    "fflags;nobuffer|"
+    "flags;low_delay|"
+    "framedrop;1|"
+    "strict;experimental|"
+    "avioflags;direct|"
+    "fflags;discardcorrupt|"
+    "max_delay;0|"
+    "reorder_queue_size;0|"
+    "analyzeduration;500000|"
+    "probesize;500000"
+)
+_FFMPEG_OPTS_STANDARD = (
+    "rtsp_transport;tcp|"
+    "buffer_size;8192000|"
+    "fflags;discardcorrupt"
+)
+
+# Decoder choices map onto FFmpeg's hwaccel selection. "cpu" skips the
+# hwaccel params entirely. Direct NVDEC would need OpenCV's cudacodec
+# module, which standard builds lack; "auto" covers it when the FFmpeg
+# build ships cuvid.
+_DECODER_ACCEL = {
+    "auto": getattr(cv2, "VIDEO_ACCELERATION_ANY", None),
+    "vaapi": getattr(cv2, "VIDEO_ACCELERATION_VAAPI", None),
+    "d3d11": getattr(cv2, "VIDEO_ACCELERATION_D3D11", None),
+    "mfx": getattr(cv2, "VIDEO_ACCELERATION_MFX", None),
+    "cpu": None,
+}
+
 
 @dataclass
 class StreamStats:
@@ -43,6 +93,11 @@ class UnifiedStream:
     - 1x ffplay (audio) - only when audio enabled
 
     This reduces connections vs having separate components.
+
+    Recording deliberately keeps its own RTSP session rather than sharing
+    decoded frames with the display pipeline: the recorder stream-copies the
+    camera's H.264/H.265 bitstream (lossless, near-zero CPU), whereas feeding
+    it decoded frames would force a lossy software re-encode of every frame.
     """
 
     # Health check settings
@@ -52,27 +107,81 @@ class UnifiedStream:
     RECONNECT_DELAY = 2.0
     SEGMENT_DURATION = 30 * 60  # 30 minutes
 
-    def __init__(self, camera: CameraConfig, output_dir: str | Path = "recordings"):
+    def __init__(
+        self,
+        camera: CameraConfig,
+        output_dir: str | Path = "recordings",
+        pixel_format: str = "bgr",
+        decoder: str = "auto",
+        backend: str = "opencv",
+        capture_cpu: int | None = None,
+        share_frames: bool = False,
+    ):
         self.camera = camera
         self.output_dir = Path(output_dir)
 
+        if backend not in ("opencv", "pyav"):
+            raise ValueError(f"Unsupported backend: {backend}")
+        if backend == "pyav" and _av is None:
+            log.warning("PyAV not installed, falling back to OpenCV backend")
+            backend = "opencv"
+        self._backend = backend
+        self._container = None
+
+        # Optional CPU pinning for the capture thread (Linux only)
+        self._capture_cpu = capture_cpu
+
+        # Optional shared-memory frame publishing for external processes
+        self._share_frames = share_frames
+        self._shm: shared_memory.SharedMemory | None = None
+        self._shm_arr: np.ndarray | None = None
+
+        if decoder not in _DECODER_ACCEL:
+            raise ValueError(f"Unsupported decoder: {decoder}")
+        self._decoder = decoder
+
+        # Frames are delivered as BGR (OpenCV's native output) unless the
+        # consumer asks for RGB, in which case the conversion happens once
+        # here instead of per consumer per frame
+        if pixel_format == "rgb":
+            self._convert_code: int | None = cv2.COLOR_BGR2RGB
+        elif pixel_format == "bgr":
+            self._convert_code = None
+        else:
+            raise ValueError(f"Unsupported pixel_format: {pixel_format}")
+        self._convert_bufs: list[np.ndarray] | None = None
+        self._convert_idx = 0
+
         # OpenCV capture for display
         self._cap: cv2.VideoCapture | None = None
         self._capture_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
 
-        # Frame data
-        self._frame: np.ndarray | None = None
-        self._frame_lock = threading.Lock()
+        # Frame data. A single-slot deque is the store: append() and [0]
+        # are atomic under the GIL, so getters never contend with the
+        # capture thread. The condition exists only to wake the dispatcher.
+        self._frame_slot: deque[np.ndarray] = deque(maxlen=1)
+        self._frame_cond = threading.Condition()
+        self._frame_seq = 0
         self._frame_callbacks: list[Callable[[np.ndarray], None]] = []
-        self._last_frame_time = 0.0
+        self._dispatch: Callable[[np.ndarray], None] | None = None
+        self._dispatch_thread: threading.Thread | None = None
+        self._last_frame_time = 0  # monotonic ns
+
+        # Double buffer for get_frame_copy so each call reuses storage
+        # instead of allocating a full frame
+        self._copy_lock = threading.Lock()
+        self._copy_bufs: list[np.ndarray] | None = None
+        self._copy_idx = 0
 
         # Recording (separate ffmpeg process)
         self._recording_process: subprocess.Popen | None = None
         self._recording_thread: threading.Thread | None = None
         self._recording_stop_event = threading.Event()
+        self._recording_wake = threading.Event()
         self._is_recording = False
         self._session_dir: Path | None = None
+        self._safe_name = ""
         self._current_file: Path | None = None
         self._recording_start_time: datetime | None = None
         self._recorded_files: list[Path] = []
@@ -103,11 +212,44 @@ class UnifiedStream:
     def add_frame_callback(self, callback: Callable[[np.ndarray], None]) -> None:
         """Add frame callback."""
         self._frame_callbacks.append(callback)
+        self._rebuild_dispatch()
 
     def remove_frame_callback(self, callback: Callable[[np.ndarray], None]) -> None:
         """Remove frame callback."""
         if callback in self._frame_callbacks:
             self._frame_callbacks.remove(callback)
+            self._rebuild_dispatch()
+
+    def _rebuild_dispatch(self) -> None:
+        """Compile the callback list into a single dispatch closure.
+
+        Most streams register zero or one callback, so specializing here
+        removes the list iteration and per-callback try/except setup from
+        the per-frame path in the capture loop.
+        """
+        callbacks = tuple(self._frame_callbacks)
+        if not callbacks:
+            self._dispatch = None
+        elif len(callbacks) == 1:
+            cb = callbacks[0]
+
+            def dispatch(frame: np.ndarray) -> None:
+                try:
+                    cb(frame)
+                except Exception:
+                    pass
+
+            self._dispatch = dispatch
+        else:
+
+            def dispatch(frame: np.ndarray) -> None:
+                for cb in callbacks:
+                    try:
+                        cb(frame)
+                    except Exception:
+                        pass
+
+            self._dispatch = dispatch
 
     @property
     def stats(self) -> StreamStats:
@@ -116,8 +258,29 @@ class UnifiedStream:
 
     def get_frame(self) -> np.ndarray | None:
         """Get latest frame."""
-        with self._frame_lock:
-            return self._frame
+        try:
+            return self._frame_slot[0]
+        except IndexError:
+            return None
+
+    def get_frame_copy(self) -> np.ndarray | None:
+        """Get a private copy of the latest frame.
+
+        frame.copy() would allocate a fresh ~6 MB buffer per call at
+        1080p; this copies into one of two preallocated buffers with
+        np.copyto (a straight memcpy) instead. Alternating buffers keeps
+        the copy handed to the previous caller intact for one more call.
+        """
+        frame = self.get_frame()
+        if frame is None:
+            return None
+        with self._copy_lock:
+            if self._copy_bufs is None or self._copy_bufs[0].shape != frame.shape:
+                self._copy_bufs = [np.empty_like(frame), np.empty_like(frame)]
+            buf = self._copy_bufs[self._copy_idx]
+            self._copy_idx ^= 1
+            np.copyto(buf, frame)
+            return buf
 
     def is_streaming(self) -> bool:
         """Check if streaming."""
@@ -132,6 +295,52 @@ class UnifiedStream:
         return self._is_recording
 
     def _connect(self) -> bool:
+        """Connect using the configured backend."""
+        if self._backend == "pyav":
+            return self._connect_pyav()
+        return self._connect_cv()
+
+    def _connect_pyav(self) -> bool:
+        """Connect using PyAV."""
+        log.info(f"Connecting to {self.camera.name} at {self.camera.address}:{self.camera.port}")
+
+        if self._container is not None:
+            try:
+                self._container.close()
+            except Exception:
+                pass
+            self._container = None
+
+        options = {"rtsp_transport": "tcp"}
+        if self.camera.low_latency:
+            log.debug("Using low-latency mode")
+            options.update({"fflags": "nobuffer", "flags": "low_delay"})
+
+        try:
+            self._container = _av.open(self.camera.rtsp_url, options=options, timeout=5.0)
+            stream = self._container.streams.video[0]
+            stream.thread_type = "AUTO"
+        except Exception as e:
+            log.error(f"Failed to open stream: {self.camera.name}: {e}")
+            self._stats.is_connected = False
+            return False
+
+        self._stats.width = stream.codec_context.width
+        self._stats.height = stream.codec_context.height
+        self._stats.fps = float(stream.average_rate) if stream.average_rate else 0.0
+        self._stats.codec = stream.codec_context.name
+
+        self._stats.is_connected = True
+        self._last_frame_time = time.monotonic_ns()
+        self._setup_shared_memory()
+
+        log.info(
+            f"Connected: {self._stats.width}x{self._stats.height} "
+            f"@ {self._stats.fps:.1f}fps ({self._stats.codec})"
+        )
+        return True
+
+    def _connect_cv(self) -> bool:
         """Connect using OpenCV."""
         log.info(f"Connecting to {self.camera.name} at {self.camera.address}:{self.camera.port}")
 
@@ -140,37 +349,54 @@ class UnifiedStream:
             self._cap = None
 
         # Set FFmpeg options for RTSP capture
-        low_latency = self.camera.low_latency
-        if low_latency:
+        if self.camera.low_latency:
             log.debug("Using low-latency mode")
-            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = (
-                "rtsp_transport;tcp|"
-                "fflags;nobuffer|"
-                "flags;low_delay|"
-                "framedrop;1|"
-                "strict;experimental|"
-                "avioflags;direct|"
-                "fflags;discardcorrupt|"
-                "analyzeduration;500000|"
-                "probesize;500000"
-            )
+            options = _FFMPEG_OPTS_LOW_LATENCY
         else:
             log.debug("Using standard mode with TCP")
-            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = (
-                "rtsp_transport;tcp|"
-                "buffer_size;8192000|"
-                "fflags;discardcorrupt"
-            )
+            options = _FFMPEG_OPTS_STANDARD
+
+        # Connect/read timeouts go through the params API so a dead camera
+        # can't hang the open indefinitely.
+        params = [
+            cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, 5000,
+            cv2.CAP_PROP_READ_TIMEOUT_MSEC, 5000,
+        ]
 
-        self._cap = cv2.VideoCapture(self.camera.rtsp_url, cv2.CAP_FFMPEG)
+        # Hardware decode selection; software decode is the dominant
+        # per-frame CPU cost on 1080p+ streams. Falls back to software
+        # below if the accelerated open fails.
+        hw_params = None
+        accel = _DECODER_ACCEL[self._decoder]
+        if accel is not None and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+            hw_params = params + [cv2.CAP_PROP_HW_ACCELERATION, accel]
+
+        # Timeouts already travel through the params API; the RTSP options
+        # string is the one thing that still has to go through the env var,
+        # scoped to the construction below.
+        with _capture_open_lock:
+            prev_options = os.environ.get("OPENCV_FFMPEG_CAPTURE_OPTIONS")
+            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = options
+            try:
+                if hw_params is not None:
+                    self._cap = cv2.VideoCapture(self.camera.rtsp_url, cv2.CAP_FFMPEG, hw_params)
+                    if not self._cap.isOpened():
+                        log.debug("Hardware-accelerated open failed, falling back to software")
+                        self._cap.release()
+                        self._cap = cv2.VideoCapture(self.camera.rtsp_url, cv2.CAP_FFMPEG, params)
+                else:
+                    self._cap = cv2.VideoCapture(self.camera.rtsp_url, cv2.CAP_FFMPEG, params)
+            finally:
+                if prev_options is None:
+                    del os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"]
+                else:
+                    os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = prev_options
 
         if not self._cap.isOpened():
             log.error(f"Failed to open stream: {self.camera.name}")
             self._stats.is_connected = False
             return False
 
-        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-
         # Get stream info
         self._stats.width = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         self._stats.height = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
@@ -178,10 +404,16 @@ class UnifiedStream:
 
         fourcc = int(self._cap.get(cv2.CAP_PROP_FOURCC))
         if fourcc > 0:
-            self._stats.codec = "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)])
+            self._stats.codec = (
+                (fourcc & 0xFFFFFFFF)
+                .to_bytes(4, "little")
+                .decode("ascii", "ignore")
+                .strip("\x00")
+            )
 
         self._stats.is_connected = True
-        self._last_frame_time = time.time()
+        self._last_frame_time = time.monotonic_ns()
+        self._setup_shared_memory()
 
         log.info(
             f"Connected: {self._stats.width}x{self._stats.height} "
@@ -200,9 +432,7 @@ class UnifiedStream:
             self._notify_status("Connection failed")
             return False
 
-        time.sleep(self.RECONNECT_DELAY)
-
-        if self._stop_event.is_set():
+        if self._stop_event.wait(self.RECONNECT_DELAY):
             return False
 
         if self._connect():
@@ -234,9 +464,14 @@ class UnifiedStream:
         self._notify_status("Streaming")
 
         # Start capture thread
-        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        target = self._capture_loop_pyav if self._backend == "pyav" else self._capture_loop
+        self._capture_thread = threading.Thread(target=target, daemon=True)
         self._capture_thread.start()
 
+        # Start callback dispatcher
+        self._dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatch_thread.start()
+
         # Start audio if enabled
         if enable_audio:
             self._start_audio()
@@ -245,106 +480,327 @@ class UnifiedStream:
         return True
 
     def _capture_loop(self) -> None:
-        """Capture loop using OpenCV."""
-        fps_start = time.time()
+        """Capture loop using OpenCV.
+
+        The low-latency flag and the capture methods are constant for the
+        lifetime of a connection, so they are bound to locals once per
+        (re)connect instead of being re-resolved on every frame.
+
+        Timekeeping uses time.monotonic_ns(): integer arithmetic is cheaper
+        than float on the per-frame path and a monotonic clock can't go
+        backwards on NTP steps and corrupt the FPS/latency stats.
+        """
+        _now_ns = time.monotonic_ns
+        fps_start = _now_ns()
         frame_count = 0
-        last_health_check = time.time()
+        frames_dropped = 0
+        latency_sum_ns = 0
+        last_health_check = fps_start
         consecutive_failures = 0
         max_consecutive_failures = 30
+        health_check_interval_ns = int(self.HEALTH_CHECK_INTERVAL * 1_000_000_000)
+        frame_timeout_ns = int(self.FRAME_TIMEOUT * 1_000_000_000)
         low_latency = self.camera.low_latency
+        convert_code = self._convert_code
+        stop_is_set = self._stop_event.is_set
+        stop_wait = self._stop_event.wait
+        running = True
 
+        self._pin_capture_thread()
         log.debug("Capture loop started")
 
-        while not self._stop_event.is_set():
-            if self._cap is None or not self._cap.isOpened():
+        while running and not stop_is_set():
+            cap = self._cap
+            if cap is None or not cap.isOpened():
                 self._stats.is_connected = False
                 if not self._reconnect():
                     break
                 consecutive_failures = 0
                 continue
 
-            current_time = time.time()
-            frame_start = current_time
-
-            # Health check
-            if current_time - last_health_check >= self.HEALTH_CHECK_INTERVAL:
-                last_health_check = current_time
-                if current_time - self._last_frame_time > self.FRAME_TIMEOUT:
-                    log.warning("Stream timeout, reconnecting...")
-                    self._notify_status("Stream timeout - reconnecting...")
-                    self._stats.is_connected = False
-                    if not self._reconnect():
+            # Per-connection bindings; the inner loop exits whenever the
+            # capture handle is replaced by a reconnect so they get rebound.
+            grab = cap.grab
+            retrieve = cap.retrieve
+            read = cap.read
+            frame_slot = self._frame_slot
+            frame_cond = self._frame_cond
+            shm_arr = self._shm_arr
+            last_frame_time = self._last_frame_time
+
+            while not stop_is_set() and cap is self._cap:
+                current_time = _now_ns()
+                frame_start = current_time
+
+                # Health check
+                if current_time - last_health_check >= health_check_interval_ns:
+                    last_health_check = current_time
+                    if current_time - last_frame_time > frame_timeout_ns:
+                        log.warning("Stream timeout, reconnecting...")
+                        self._notify_status("Stream timeout - reconnecting...")
+                        self._stats.is_connected = False
+                        if not self._reconnect():
+                            running = False
+                        consecutive_failures = 0
                         break
-                    consecutive_failures = 0
-                    continue
 
-            # Read frame
-            if low_latency:
-                # Drain buffer, keep only latest
-                grabbed = False
-                for _ in range(3):
-                    if self._cap.grab():
-                        grabbed = True
-                    else:
-                        break
+                # Read frame
+                if low_latency:
+                    # Drain buffer, keep only latest
+                    grabbed = False
+                    for _ in range(3):
+                        if grab():
+                            grabbed = True
+                        else:
+                            break
+
+                    if not grabbed:
+                        consecutive_failures += 1
+                        if consecutive_failures >= max_consecutive_failures:
+                            log.warning("Stream stalled, reconnecting...")
+                            self._notify_status("Stream stalled - reconnecting...")
+                            self._stats.is_connected = False
+                            if not self._reconnect():
+                                running = False
+                            consecutive_failures = 0
+                            break
+                        # Wait on the stop event rather than a blind
+                        # sleep so shutdown interrupts the retry instantly
+                        stop_wait(0.01)
+                        continue
 
-                if not grabbed:
+                    ret, frame = retrieve()
+                else:
+                    ret, frame = read()
+
+                if not ret or frame is None:
+                    # Batched into stats with the once-a-second flush below
+                    frames_dropped += 1
                     consecutive_failures += 1
                     if consecutive_failures >= max_consecutive_failures:
-                        log.warning("Stream stalled, reconnecting...")
+                        log.warning("Too many frame failures, reconnecting...")
                         self._notify_status("Stream stalled - reconnecting...")
                         self._stats.is_connected = False
                         if not self._reconnect():
-                            break
+                            running = False
                         consecutive_failures = 0
-                    else:
-                        time.sleep(0.01)
+                        break
                     continue
 
-                ret, frame = self._cap.retrieve()
-            else:
-                ret, frame = self._cap.read()
+                consecutive_failures = 0
+                current_time = _now_ns()
+                last_frame_time = current_time
+                latency_sum_ns += current_time - frame_start
+                frame_count += 1
+
+                # Publish stats roughly once a second instead of per frame;
+                # the GUI only polls them at ~10 Hz anyway.
+                elapsed_ns = current_time - fps_start
+                if elapsed_ns >= 1_000_000_000:
+                    stats = self._stats
+                    stats.fps = frame_count * 1_000_000_000 / elapsed_ns
+                    stats.frames_received += frame_count
+                    stats.frames_dropped += frames_dropped
+                    stats.latency_ms = latency_sum_ns / (frame_count * 1_000_000)
+                    self._last_frame_time = last_frame_time
+                    frame_count = 0
+                    frames_dropped = 0
+                    latency_sum_ns = 0
+                    fps_start = _now_ns()
+
+                # Optional colorspace conversion at the source, into
+                # alternating reused buffers (SIMD cvtColor, no allocation,
+                # and the frame a consumer just fetched isn't rewritten)
+                if convert_code is not None:
+                    bufs = self._convert_bufs
+                    if bufs is None or bufs[0].shape != frame.shape:
+                        bufs = [np.empty_like(frame), np.empty_like(frame)]
+                        self._convert_bufs = bufs
+                    buf = bufs[self._convert_idx]
+                    self._convert_idx ^= 1
+                    cv2.cvtColor(frame, convert_code, dst=buf)
+                    frame = buf
+
+                # Publish the frame (atomic single-slot append, no lock
+                # held while getters read) and wake the dispatcher
+                frame_slot.append(frame)
+                if shm_arr is not None and frame.shape == shm_arr.shape:
+                    np.copyto(shm_arr, frame)
+                with frame_cond:
+                    self._frame_seq += 1
+                    frame_cond.notify_all()
+
+            # The inner loop exits on stop or reconnect; don't lose drops
+            # accumulated since the last flush.
+            if frames_dropped:
+                self._stats.frames_dropped += frames_dropped
+                frames_dropped = 0
 
-            if not ret or frame is None:
-                self._stats.frames_dropped += 1
-                consecutive_failures += 1
-                if consecutive_failures >= max_consecutive_failures:
-                    log.warning("Too many frame failures, reconnecting...")
-                    self._notify_status("Stream stalled - reconnecting...")
-                    self._stats.is_connected = False
-                    if not self._reconnect():
-                        break
-                    consecutive_failures = 0
+        self._stats.is_connected = False
+        log.debug("Capture loop ended")
+
+    def _dispatch_loop(self) -> None:
+        """Deliver frames to callbacks on a dedicated thread.
+
+        Callbacks used to run inline in the capture loop, so one slow
+        consumer (a GUI redraw, say) delayed acquisition and showed up as
+        dropped frames. This thread always delivers the newest published
+        frame and silently skips any frames it missed while a callback ran.
+        """
+        cond = self._frame_cond
+        stop_is_set = self._stop_event.is_set
+        seen = 0
+
+        while not stop_is_set():
+            with cond:
+                if self._frame_seq == seen:
+                    cond.wait(timeout=0.5)
+                if self._frame_seq == seen:
+                    continue
+                seen = self._frame_seq
+            frame = self.get_frame()
+
+            # Dispatch is rebuilt whenever the callback list changes
+            dispatch = self._dispatch
+            if dispatch is not None and frame is not None:
+                dispatch(frame)
+
+        log.debug("Dispatch loop ended")
+
+    def _pin_capture_thread(self) -> None:
+        """Pin the capture thread to a core and raise its priority.
+
+        Opt-in via capture_cpu; keeps scheduler preemption from showing up
+        as spurious latency spikes on busy hosts. Affinity is Linux-only
+        and SCHED_RR needs CAP_SYS_NICE, so both steps fail silently where
+        unsupported or unprivileged.
+        """
+        if self._capture_cpu is None:
+            return
+        try:
+            os.sched_setaffinity(0, {self._capture_cpu})
+            log.debug(f"Capture thread pinned to CPU {self._capture_cpu}")
+        except (AttributeError, OSError):
+            pass
+        try:
+            os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(10))
+            log.debug("Capture thread running with SCHED_RR priority")
+        except (AttributeError, OSError):
+            pass
+
+    def _setup_shared_memory(self) -> None:
+        """Publish decoded frames into a shared-memory segment (opt-in).
+
+        Other processes attach zero-copy instead of opening and decoding
+        the stream a second time:
+
+            shm = SharedMemory(name=f"rtsp_{safe_camera_name}")
+            frame = np.ndarray((h, w, 3), np.uint8, buffer=shm.buf)
+
+        Readers should treat the segment as latest-frame-wins; there is no
+        cross-process locking.
+        """
+        if not self._share_frames or self._stats.width <= 0:
+            return
+
+        h, w = self._stats.height, self._stats.width
+        size = h * w * 3
+        if self._shm is not None and self._shm.size == size:
+            return  # reconnect with unchanged geometry
+
+        self._teardown_shared_memory()
+        safe_name = "".join(
+            c if c.isalnum() or c in "-_" else "_" for c in self.camera.name
+        )
+        name = f"rtsp_{safe_name}"
+        try:
+            try:
+                self._shm = shared_memory.SharedMemory(create=True, size=size, name=name)
+            except FileExistsError:
+                # Stale segment from a previous run; attach and reuse
+                self._shm = shared_memory.SharedMemory(name=name)
+            self._shm_arr = np.ndarray((h, w, 3), np.uint8, buffer=self._shm.buf)
+            log.info(f"Sharing frames via shared memory: {name} ({size} bytes)")
+        except Exception as e:
+            log.warning(f"Shared-memory publishing unavailable: {e}")
+            self._shm = None
+            self._shm_arr = None
+
+    def _teardown_shared_memory(self) -> None:
+        """Release the shared-memory segment, if any."""
+        if self._shm is None:
+            return
+        self._shm_arr = None
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except Exception:
+            pass
+        self._shm = None
+
+    def _capture_loop_pyav(self) -> None:
+        """Capture loop using PyAV.
+
+        libav decodes on its own worker threads and to_ndarray converts
+        straight to the requested pixel format in swscale, so this thread
+        only publishes finished frames. Timekeeping uses monotonic_ns for
+        the same reasons as _capture_loop.
+        """
+        _now_ns = time.monotonic_ns
+        fps_start = _now_ns()
+        frame_count = 0
+        av_format = "rgb24" if self._convert_code is not None else "bgr24"
+        stop_is_set = self._stop_event.is_set
+        frame_slot = self._frame_slot
+        frame_cond = self._frame_cond
+        running = True
+
+        self._pin_capture_thread()
+        log.debug("PyAV capture loop started")
+
+        while running and not stop_is_set():
+            container = self._container
+            if container is None:
+                if not self._reconnect():
+                    break
                 continue
 
-            consecutive_failures = 0
-            current_time = time.time()
-            decode_time = current_time - frame_start
-            self._last_frame_time = current_time
-            self._stats.frames_received += 1
-            self._stats.latency_ms = decode_time * 1000
-            frame_count += 1
-
-            # Update FPS
-            elapsed = current_time - fps_start
-            if elapsed >= 1.0:
-                self._stats.fps = frame_count / elapsed
-                frame_count = 0
-                fps_start = time.time()
-
-            # Store frame
-            with self._frame_lock:
-                self._frame = frame
-
-            # Callbacks
-            for cb in self._frame_callbacks:
-                try:
-                    cb(frame)
-                except Exception:
-                    pass
+            shm_arr = self._shm_arr
+            try:
+                for av_frame in container.decode(video=0):
+                    if stop_is_set() or container is not self._container:
+                        break
+                    frame = av_frame.to_ndarray(format=av_format)
+
+                    current_time = _now_ns()
+                    frame_count += 1
+                    elapsed_ns = current_time - fps_start
+                    if elapsed_ns >= 1_000_000_000:
+                        stats = self._stats
+                        stats.fps = frame_count * 1_000_000_000 / elapsed_ns
+                        stats.frames_received += frame_count
+                        self._last_frame_time = current_time
+                        frame_count = 0
+                        fps_start = current_time
+
+                    frame_slot.append(frame)
+                    if shm_arr is not None and frame.shape == shm_arr.shape:
+                        np.copyto(shm_arr, frame)
+                    with frame_cond:
+                        self._frame_seq += 1
+                        frame_cond.notify_all()
+                else:
+                    raise EOFError("stream ended")
+            except Exception as e:
+                if stop_is_set():
+                    break
+                log.warning(f"PyAV capture error: {e}")
+                self._stats.is_connected = False
+                if not self._reconnect():
+                    running = False
 
         self._stats.is_connected = False
-        log.debug("Capture loop ended")
+        log.debug("PyAV capture loop ended")
 
     # --- Audio ---
 
@@ -416,8 +872,10 @@ class UnifiedStream:
         # Create session directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.camera.name)
-        self._session_dir = self.output_dir / f"{safe_name}_{timestamp}"
+        self._safe_name = "".join(
+            c if c.isalnum() or c in "-_" else "_" for c in self.camera.name
+        )
+        self._session_dir = self.output_dir / f"{self._safe_name}_{timestamp}"
         self._session_dir.mkdir(parents=True, exist_ok=True)
 
         self._recording_start_time = datetime.now()
@@ -444,35 +902,16 @@ class UnifiedStream:
         while self._is_recording and not self._recording_stop_event.is_set():
             segment_num += 1
 
-            # Generate filename
+            # Generate filename (safe_name is precomputed in start_recording)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.camera.name)
-            self._current_file = self._session_dir / f"{safe_name}_{timestamp}.mp4"
+            self._current_file = self._session_dir / f"{self._safe_name}_{timestamp}.mp4"
 
             log.info(f"Starting segment {segment_num}: {self._current_file.name}")
 
-            # Build ffmpeg command
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-rtsp_transport", "tcp",
-                "-fflags", "+genpts+discardcorrupt",
-                "-buffer_size", "8192000",
-                "-use_wallclock_as_timestamps", "1",
-                "-i", self.camera.rtsp_url,
-                "-c:v", "copy",
-                "-reset_timestamps", "1",
-            ]
-
-            if self._record_audio:
-                cmd.extend(["-c:a", "aac", "-b:a", "128k"])
-            else:
-                cmd.extend(["-an"])
-
-            cmd.extend([
-                "-movflags", "+frag_keyframe+empty_moov+default_base_moof",
-                str(self._current_file),
-            ])
+            # Build ffmpeg command (shared with Recorder)
+            cmd = build_recording_command(
+                self.camera.rtsp_url, self._current_file, self._record_audio
+            )
 
             stderr_lines: list[str] = []
 
@@ -498,12 +937,23 @@ class UnifiedStream:
                 )
                 stderr_thread.start()
 
-                # Wait for segment duration
+                # Wait for segment rotation, ffmpeg exit or stop without
+                # polling: a watcher thread fires the wake event the moment
+                # ffmpeg exits, and stop_recording fires it on stop.
                 segment_start = time.time()
                 segment_failed = False
+                proc = self._recording_process
+                wake = self._recording_wake
+                wake.clear()
+
+                def watch(proc: subprocess.Popen, wake: threading.Event) -> None:
+                    proc.wait()
+                    wake.set()
+
+                threading.Thread(target=watch, args=(proc, wake), daemon=True).start()
 
                 while self._is_recording and not self._recording_stop_event.is_set():
-                    exit_code = self._recording_process.poll()
+                    exit_code = proc.poll()
                     if exit_code is not None:
                         elapsed = time.time() - segment_start
                         if exit_code != 0 or elapsed < 5.0:
@@ -514,12 +964,13 @@ class UnifiedStream:
                             segment_failed = True
                         break
 
-                    elapsed = time.time() - segment_start
-                    if elapsed >= self.SEGMENT_DURATION:
+                    remaining = self.SEGMENT_DURATION - (time.time() - segment_start)
+                    if remaining <= 0:
                         log.info(f"Segment {segment_num} complete, rotating...")
                         break
 
-                    self._recording_stop_event.wait(0.5)
+                    wake.wait(remaining)
+                    wake.clear()
 
                 # Graceful stop
                 self._stop_recording_process()
@@ -601,6 +1052,7 @@ class UnifiedStream:
 
         log.info("Stopping recording...")
         self._recording_stop_event.set()
+        self._recording_wake.set()
         self._is_recording = False
 
         if self._recording_thread:
@@ -630,6 +1082,8 @@ class UnifiedStream:
         log.info("Stopping unified stream...")
 
         self._stop_event.set()
+        with self._frame_cond:
+            self._frame_cond.notify_all()
 
         # Stop recording
         if self._is_recording:
@@ -643,15 +1097,24 @@ class UnifiedStream:
             self._cap.release()
             self._cap = None
 
+        if self._container is not None:
+            try:
+                self._container.close()
+            except Exception:
+                pass
+            self._container = None
+
         if self._capture_thread:
             self._capture_thread.join(timeout=2.0)
             self._capture_thread = None
 
-        # Cleanup environment
-        if "OPENCV_FFMPEG_CAPTURE_OPTIONS" in os.environ:
-            del os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"]
+        if self._dispatch_thread:
+            self._dispatch_thread.join(timeout=2.0)
+            self._dispatch_thread = None
+
+        self._teardown_shared_memory()
 
         self._stats.is_connected = False
-        self._frame = None
+        self._frame_slot.clear()
 
         log.info("Unified stream stopped")
@@ -1,5 +1,9 @@
 """Main RTSP Viewer controller using unified stream."""
 
+import re
+import socket
+import threading
+import time
 from collections.abc import Callable
 from pathlib import Path
 
@@ -7,38 +11,184 @@ import numpy as np
 
 from rtsp_viewer.core.config import CameraConfig, load_cameras
 from rtsp_viewer.core.unified_stream import UnifiedStream, StreamStats
+from rtsp_viewer.utils.logger import get_logger
+
+log = get_logger("viewer")
+
+# Shape CameraConfig.rtsp_url produces: scheme, authority (credentials,
+# host, port — anything but whitespace or a slash), optional path.
+# Compiled once; validation of N cameras is then one DFA pass per URL.
+_RTSP_URL_RE = re.compile(r"^rtsps?://[^\s/]+(?:/\S*)?$")
+
+# Returned by get_stream_info when no stream is active; the GUI polls at
+# ~10 Hz and allocating a fresh StreamStats per poll is pointless churn.
+# StreamStats stays mutable for the capture path, so treat this one as
+# read-only by convention.
+_EMPTY_STATS = StreamStats()
+
+
+class _StatusCoalescer:
+    """Drop repeats of the same status arriving within a short window.
+
+    Reconnect storms and per-frame stalls can fire the identical status
+    string many times in a burst; each delivery crosses into the GUI
+    (usually via Tk's event queue), so the bursts are pure overhead.
+    A different status always passes through immediately — only exact
+    repeats inside the window are dropped, so no transition is lost.
+    """
+
+    WINDOW = 0.05
+
+    def __init__(self, callback: Callable[[str], None]):
+        self.callback = callback
+        self._last_status: str | None = None
+        self._last_time = 0.0
+
+    def __call__(self, status: str) -> None:
+        now = time.monotonic()
+        if status == self._last_status and now - self._last_time < self.WINDOW:
+            return
+        self._last_status = status
+        self._last_time = now
+        self.callback(status)
 
 
 class RTSPViewer:
     """Main controller for the RTSP viewer application."""
 
-    def __init__(self, config_path: str | Path = "cameras.yaml"):
+    # Fixed attribute set: drops the per-instance __dict__ and turns
+    # attribute access into index loads on the hot get_frame/is_streaming
+    # polling paths; matters when a grid holds one viewer per camera
+    __slots__ = (
+        "config_path",
+        "_cameras",
+        "_current_camera_index",
+        "_current_camera",
+        "_config_sig",
+        "_share_frames",
+        "_stream",
+        "_streaming_event",
+        "_recording_event",
+        "_status_callback",
+        "_prewarm_thread",
+    )
+
+    def __init__(
+        self,
+        config_path: str | Path = "cameras.yaml",
+        share_frames: bool = False,
+    ):
         self.config_path = Path(config_path)
         self._cameras: list[CameraConfig] = []
         self._current_camera_index: int = -1
+        # Resolved selection, updated by select_camera/reload_config so
+        # per-tick callers skip the index bounds check
+        self._current_camera: CameraConfig | None = None
+
+        # (st_mtime_ns, st_size) of the config last parsed; reloads skip
+        # the YAML parse when the file hasn't changed
+        self._config_sig: tuple[int, int] | None = None
+
+        # Publish decoded frames into named shared memory so external
+        # processes can attach zero-copy (see UnifiedStream.share_frames)
+        self._share_frames = share_frames
 
         # Unified stream manager
         self._stream: UnifiedStream | None = None
 
+        # Session flags polled by the GUI every tick. Event.is_set() is a
+        # C-level read, cheaper than chasing state through the stream,
+        # and they don't flicker during transient reconnects.
+        self._streaming_event = threading.Event()
+        self._recording_event = threading.Event()
+
         # Callbacks
         self._status_callback: Callable[[str], None] | None = None
 
         # Load initial configuration
         self.reload_config()
 
+        # Warm up the network path to the default camera while the GUI
+        # is still building, shaving the TCP setup RTT off the first
+        # play click
+        self._prewarm_thread: threading.Thread | None = None
+        if self._cameras:
+            self._prewarm_thread = threading.Thread(
+                target=self._prewarm,
+                args=(self._cameras[0],),
+                daemon=True,
+                name="rtsp-prewarm",
+            )
+            self._prewarm_thread.start()
+
+    def _validate_urls(self) -> None:
+        """Flag cameras whose generated RTSP URL is malformed.
+
+        Catches config mistakes (whitespace in the address, an embedded
+        slash, a blank host) at reload time instead of as an opaque
+        connect failure minutes later.
+        """
+        for camera in self._cameras:
+            if not _RTSP_URL_RE.match(camera.rtsp_url):
+                message = (
+                    f"Camera '{camera.name}' has an invalid RTSP URL: "
+                    f"{camera.rtsp_url_display}"
+                )
+                log.warning(message)
+                if self._status_callback:
+                    self._status_callback(message)
+
+    def _prewarm(self, camera: CameraConfig) -> None:
+        """Open and close a TCP connection to the camera.
+
+        Warms DNS, ARP, and the camera's accept path so the real RTSP
+        connect on the first play click starts from a hot state. A full
+        DESCRIBE/SETUP can't be cached here because the capture backends
+        own their RTSP sessions end to end; an offline camera is simply
+        ignored and surfaces normally on start_stream.
+        """
+        try:
+            socket.create_connection((camera.address, camera.port), timeout=2).close()
+        except OSError:
+            pass
+
     def set_status_callback(self, callback: Callable[[str], None] | None) -> None:
-        """Set a callback to receive stream status updates."""
-        self._status_callback = callback
+        """Set a callback to receive stream status updates.
+
+        The callback is wrapped in a coalescer that drops identical
+        statuses repeated within 50 ms, bounding delivery cost during
+        reconnect bursts without losing any state transition.
+        """
+        self._status_callback = (
+            _StatusCoalescer(callback) if callback is not None else None
+        )
+        if self._stream is not None:
+            self._stream.set_status_callback(self._status_callback)
 
     def reload_config(self) -> None:
-        """Reload camera configuration from file."""
+        """Reload camera configuration from file.
+
+        Re-parsing YAML costs tens of milliseconds for nontrivial
+        configs, so an unchanged file (same mtime and size) keeps the
+        already-parsed camera list and the reload is just a stat call.
+        """
         try:
-            self._cameras = load_cameras(self.config_path)
+            st = self.config_path.stat()
+            sig = (st.st_mtime_ns, st.st_size)
+            if sig != self._config_sig:
+                self._cameras = load_cameras(self.config_path)
+                self._config_sig = sig
             if self._cameras and self._current_camera_index < 0:
                 self._current_camera_index = 0
+            self._validate_urls()
         except FileNotFoundError:
             self._cameras = []
             self._current_camera_index = -1
+            self._config_sig = None
+        if 0 <= self._current_camera_index < len(self._cameras):
+            self._current_camera = self._cameras[self._current_camera_index]
+        else:
+            self._current_camera = None
 
     def get_cameras(self) -> list[CameraConfig]:
         """Get list of configured cameras."""
@@ -50,51 +200,95 @@ class RTSPViewer:
             # Stop current stream if active
             self.stop_stream()
             self._current_camera_index = index
+            self._current_camera = self._cameras[index]
+            # Pre-build the stream while the user is still browsing so
+            # the play click only pays for start(), not construction
+            self._stream = self._build_stream(self._current_camera)
             return True
         return False
 
     def get_current_camera(self) -> CameraConfig | None:
         """Get the currently selected camera configuration."""
-        if 0 <= self._current_camera_index < len(self._cameras):
-            return self._cameras[self._current_camera_index]
-        return None
+        return self._current_camera
+
+    def _build_stream(self, camera: CameraConfig) -> UnifiedStream:
+        """Construct a stream for camera with callbacks wired up."""
+        stream = UnifiedStream(camera, share_frames=self._share_frames)
+        if self._status_callback:
+            stream.set_status_callback(self._status_callback)
+        return stream
 
     def start_stream(self, enable_audio: bool = True) -> bool:
         """Start streaming from the current camera."""
-        camera = self.get_current_camera()
+        camera = self._current_camera
         if camera is None:
             return False
 
-        # Create unified stream
-        self._stream = UnifiedStream(camera)
-
-        # Wire up status callback
-        if self._status_callback:
-            self._stream.set_status_callback(self._status_callback)
+        # Normally pre-built by select_camera; rebuild after stop_stream
+        if self._stream is None:
+            self._stream = self._build_stream(camera)
 
-        return self._stream.start(enable_audio=enable_audio)
+        started = self._stream.start(enable_audio=enable_audio)
+        if started:
+            self._streaming_event.set()
+        return started
 
     def stop_stream(self) -> None:
         """Stop the current stream."""
+        self._streaming_event.clear()
+        self._recording_event.clear()
         if self._stream is not None:
             self._stream.stop()
             self._stream = None
 
     def is_streaming(self) -> bool:
-        """Check if currently streaming."""
-        return self._stream is not None and self._stream.is_streaming()
+        """Check if a streaming session is active.
+
+        Reflects the requested session state (set on start, cleared on
+        stop), so it stays true through transient reconnects; consult
+        get_stream_info().is_connected for the live link state.
+        """
+        return self._streaming_event.is_set()
+
+    def get_frame(self, copy: bool = False) -> np.ndarray | None:
+        """Get the latest video frame as a read-only view.
+
+        The array shares the stream's internal buffer and is marked
+        non-writeable, so an accidental in-place edit raises a
+        ValueError instead of silently corrupting the frame other
+        consumers see (or forcing defensive copies everywhere). Callers
+        that need to mutate pass copy=True and get a private frame via
+        get_frame_copy's preallocated buffers.
+        """
+        if self._stream is None:
+            return None
+        if copy:
+            return self._stream.get_frame_copy()
+        frame = self._stream.get_frame()
+        if frame is None:
+            return None
+        # A view object is ~100 bytes; the pixels are not copied
+        view = frame.view()
+        view.flags.writeable = False
+        return view
+
+    def get_frame_copy(self) -> np.ndarray | None:
+        """Get a private copy of the latest frame.
 
-    def get_frame(self) -> np.ndarray | None:
-        """Get the latest video frame."""
+        Callers that hold a frame across UI ticks should use this rather
+        than frame.copy(): the stream copies into preallocated
+        alternating buffers, so steady state does no per-frame
+        allocation (~6 MB/frame at 1080p, ~24 MB at 4K).
+        """
         if self._stream is not None:
-            return self._stream.get_frame()
+            return self._stream.get_frame_copy()
         return None
 
     def get_stream_info(self) -> StreamStats:
         """Get current stream information."""
         if self._stream is not None:
             return self._stream.stats
-        return StreamStats()
+        return _EMPTY_STATS
 
     def get_actual_fps(self) -> float:
         """Get actual measured FPS."""
@@ -116,17 +310,21 @@ class RTSPViewer:
         """Start recording the current stream."""
         if self._stream is None:
             return False
-        return self._stream.start_recording(record_audio=record_audio)
+        started = self._stream.start_recording(record_audio=record_audio)
+        if started:
+            self._recording_event.set()
+        return started
 
     def stop_recording(self) -> Path | None:
         """Stop recording and return the path to the recorded file."""
+        self._recording_event.clear()
         if self._stream is not None:
             return self._stream.stop_recording()
         return None
 
     def is_recording(self) -> bool:
         """Check if currently recording."""
-        return self._stream is not None and self._stream.is_recording()
+        return self._recording_event.is_set()
 
     def get_recording_duration(self) -> float:
         """Get current recording duration in seconds."""
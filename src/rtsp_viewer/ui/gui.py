@@ -1,6 +1,6 @@
 """GUI for RTSP stream viewer using tkinter."""
 
-import queue
+import os
 import sys
 import threading
 import tkinter as tk
@@ -35,9 +35,13 @@ class ViewerGUI:
         self._photo: ImageTk.PhotoImage | None = None
         self._update_scheduled = False
 
-        # Console log handling
-        self._log_queue: queue.Queue[str] = queue.Queue()
+        # Console log handling (double-buffered: writers append under the
+        # lock, the UI thread swaps the whole batch out in one operation)
+        self._log_buffer: list[str] = []
+        self._log_lock = threading.Lock()
         self._log_handler: GUILogHandler | None = None
+        self._log_pipe: tuple[int, int] | None = None
+        self._console_lines = 0
         self._console_visible = False
 
         # State persistence
@@ -263,33 +267,66 @@ class ViewerGUI:
 
     def _setup_log_handler(self) -> None:
         """Set up the log handler for GUI console."""
+        # On Unix a self-pipe plus createfilehandler lets Tk sleep until a
+        # message actually arrives instead of polling ten times a second;
+        # the writer pokes one wake byte per burst. Windows Tk has no
+        # createfilehandler, so fall back to the 100 ms polling loop there.
+        if hasattr(self.root.tk, "createfilehandler"):
+            try:
+                self._log_pipe = os.pipe()
+                os.set_blocking(self._log_pipe[1], False)
+                self.root.tk.createfilehandler(
+                    self._log_pipe[0], tk.READABLE, self._drain_log
+                )
+            except (OSError, tk.TclError):
+                self._log_pipe = None
+
+        pipe = self._log_pipe
+
         def log_callback(msg: str) -> None:
-            self._log_queue.put(msg)
+            with self._log_lock:
+                self._log_buffer.append(msg)
+                first = len(self._log_buffer) == 1
+            if pipe is not None and first:
+                try:
+                    os.write(pipe[1], b"\x00")
+                except OSError:
+                    pass  # wake already pending; drain will pick this up
 
         self._log_handler = add_gui_handler(log_callback)
-        self._process_log_queue()
+        if pipe is None:
+            self._process_log_queue()
+
+    def _drain_log(self, fd: int, mask: int) -> None:
+        """Flush buffered log messages when the self-pipe wakes Tk."""
+        os.read(fd, 4096)
+        with self._log_lock:
+            batch, self._log_buffer = self._log_buffer, []
+        if batch:
+            self._append_to_console(batch)
 
     def _process_log_queue(self) -> None:
-        """Process queued log messages and add them to the console."""
-        try:
-            while True:
-                msg = self._log_queue.get_nowait()
-                self._append_to_console(msg)
-        except queue.Empty:
-            pass
+        """Polling fallback for platforms without createfilehandler."""
+        with self._log_lock:
+            batch, self._log_buffer = self._log_buffer, []
+        if batch:
+            self._append_to_console(batch)
 
         # Schedule next check
         self.root.after(100, self._process_log_queue)
 
-    def _append_to_console(self, msg: str) -> None:
-        """Append a message to the console text widget."""
+    def _append_to_console(self, messages: list[str]) -> None:
+        """Append a batch of messages to the console text widget."""
         self.console_text.configure(state=tk.NORMAL)
-        self.console_text.insert(tk.END, msg + "\n")
+        self.console_text.insert(tk.END, "\n".join(messages) + "\n")
+        self._console_lines += len(messages)
 
-        # Limit to 1000 lines
-        line_count = int(self.console_text.index("end-1c").split(".")[0])
-        if line_count > 1000:
-            self.console_text.delete("1.0", f"{line_count - 1000}.0")
+        # Keep roughly 1000 lines, trimming in chunks so the delete runs
+        # once every ~100 messages instead of on every append
+        if self._console_lines > 1000:
+            trim = self._console_lines - 900
+            self.console_text.delete("1.0", f"{trim + 1}.0")
+            self._console_lines -= trim
 
         self.console_text.see(tk.END)
         self.console_text.configure(state=tk.DISABLED)
@@ -308,6 +345,7 @@ class ViewerGUI:
         self.console_text.configure(state=tk.NORMAL)
         self.console_text.delete("1.0", tk.END)
         self.console_text.configure(state=tk.DISABLED)
+        self._console_lines = 0
 
     def _setup_bindings(self) -> None:
         """Set up keyboard and event bindings."""
@@ -626,6 +664,16 @@ class ViewerGUI:
             remove_gui_handler(self._log_handler)
             self._log_handler = None
 
+        # Tear down the self-pipe wake channel
+        if self._log_pipe is not None:
+            try:
+                self.root.tk.deletefilehandler(self._log_pipe[0])
+            except tk.TclError:
+                pass
+            os.close(self._log_pipe[0])
+            os.close(self._log_pipe[1])
+            self._log_pipe = None
+
         self.viewer.stop_all()
         self.root.destroy()
 
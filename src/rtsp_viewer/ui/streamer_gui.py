@@ -1,23 +1,124 @@
 """GUI for RTSP streamer using tkinter."""
 
+import os
 import queue
 import sys
 import threading
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, ttk
-
-import cv2
-import numpy as np
-from PIL import Image, ImageTk
+from typing import TYPE_CHECKING
 
 from rtsp_viewer.core.gst_streamer import GstRTSPStreamer
 from rtsp_viewer.core.streamer import DEFAULT_PORT, RTSPStreamer
 from rtsp_viewer.utils.logger import GUILogHandler, add_gui_handler, get_logger, remove_gui_handler
 from rtsp_viewer.utils.state import AppState
 
+if TYPE_CHECKING:
+    import cv2
+    import numpy as np
+    from PIL import Image, ImageTk
+
 log = get_logger("streamer_gui")
 
+# cv2, numpy, PIL and PyAV are imported lazily: together they add hundreds
+# of milliseconds and a lot of RSS to GUI startup, and none are needed until
+# the user actually opens a preview. PyAV (when present on macOS) lets the
+# preview decode through VideoToolbox instead of OpenCV's CPU path.
+av = None
+
+
+def _import_pyav():
+    """Import PyAV on first use; returns the module or None."""
+    global av
+    if av is None:
+        try:
+            import av as _av
+            av = _av
+        except ImportError:
+            av = False
+    return av or None
+
+
+# Decoded, thumbnailed icon shared across windows; the source PNG can be
+# 512x512 or larger and the dock/taskbar never needs more than ~64px
+_icon_cache: dict = {}
+
+
+def _load_icon_image(png_path: Path):
+    """Decode the app icon once per process, downscaled to taskbar size."""
+    image = _icon_cache.get(png_path)
+    if image is None:
+        from PIL import Image
+
+        image = Image.open(png_path)
+        image.thumbnail((64, 64), Image.Resampling.LANCZOS)
+        _icon_cache[png_path] = image
+    return image
+
+
+class _PyAVPreview:
+    """cv2.VideoCapture-shaped wrapper over a PyAV container.
+
+    Lets the preview worker use hardware decode (VideoToolbox on macOS)
+    without changing its grab/retrieve loop. Frames come back as BGR
+    ndarrays converted by swscale.
+    """
+
+    def __init__(self, path: str):
+        self._container = None
+        self._frame = None
+        if _import_pyav() is None:
+            return
+        try:
+            options = {"hwaccel": "videotoolbox"} if sys.platform == "darwin" else {}
+            self._container = av.open(path, options=options)
+            self._stream = self._container.streams.video[0]
+            self._stream.thread_type = "AUTO"
+            self._frames = self._container.decode(self._stream)
+        except Exception as e:
+            log.debug(f"PyAV open failed, will fall back to cv2: {e}")
+            if self._container is not None:
+                self._container.close()
+                self._container = None
+
+    def isOpened(self) -> bool:  # noqa: N802 - matches cv2.VideoCapture
+        return self._container is not None
+
+    def grab(self) -> bool:
+        try:
+            self._frame = next(self._frames)
+            return True
+        except (StopIteration, av.AVError):
+            self._frame = None
+            return False
+
+    def retrieve(self) -> tuple[bool, "np.ndarray | None"]:
+        if self._frame is None:
+            return False, None
+        return True, self._frame.to_ndarray(format="bgr24")
+
+    def get(self, prop: int) -> float:
+        import cv2
+
+        if prop == cv2.CAP_PROP_FPS and self._stream.average_rate:
+            return float(self._stream.average_rate)
+        return 0.0
+
+    def set(self, prop: int, value: float) -> bool:  # noqa: A003
+        import cv2
+
+        if prop == cv2.CAP_PROP_POS_FRAMES and value == 0:
+            self._container.seek(0)
+            self._frames = self._container.decode(self._stream)
+            return True
+        return False
+
+    def release(self) -> None:
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+
 class StreamerGUI:
     """GUI window for RTSP streamer."""
 
@@ -46,14 +147,52 @@ class StreamerGUI:
         self._streamer: RTSPStreamer | GstRTSPStreamer | None = None
         self._video_path: Path | None = None
 
-        # Preview state
+        # Probe backend availability once: the checks shell out to
+        # shutil.which and the combobox handler re-reads them on every
+        # selection change, so they must not fork each time
+        self._backend_caps = {
+            "gstreamer": GstRTSPStreamer.check_dependencies(),
+            "ffmpeg": RTSPStreamer.check_dependencies(),
+        }
+
+        # Preview state. Decode/resize/convert run on a worker thread that
+        # hands finished RGB frames to the Tk thread through a 1-slot queue.
         self._preview_running = False
-        self._preview_cap: cv2.VideoCapture | None = None
+        self._preview_cap: cv2.VideoCapture | _PyAVPreview | None = None
+        self._preview_thread: threading.Thread | None = None
+        self._preview_stop = threading.Event()
+        self._preview_visible = threading.Event()
+        self._preview_queue: queue.Queue[tuple[Image.Image, int, int, tuple[int, int]]] = (
+            queue.Queue(maxsize=1)
+        )
         self._photo: ImageTk.PhotoImage | None = None
-
-        # Console log handling
-        self._log_queue: queue.Queue[str] = queue.Queue()
+        self._photo_size: tuple[int, int] | None = None
+        self._canvas_image_id: int | None = None
+        self._preview_skip = 0
+        self._preview_after_id: str | None = None
+        self._canvas_size = (0, 0)
+        self._pending_canvas_size = (0, 0)
+        self._resize_after_id: str | None = None
+        self._resize_buf: np.ndarray | None = None
+        # Ring of output buffers so the worker never overwrites the frame
+        # the UI thread is still pasting from. Each slot has a PIL Image
+        # created once over its memory (RGBA frombuffer shares, not copies).
+        self._rgb_bufs: list[np.ndarray | None] = [None, None, None]
+        self._pil_images: list[Image.Image | None] = [None, None, None]
+        self._rgb_index = 0
+        # (frame_w, frame_h, canvas_w, canvas_h) -> display size and offset
+        self._layout_cache: tuple[tuple[int, int, int, int], int, int, int, int] | None = None
+
+        # Console log handling (double-buffered: writers append under the
+        # lock, the UI thread swaps the whole batch out in one operation)
+        self._log_buffer: list[str] = []
+        self._log_lock = threading.Lock()
         self._log_handler: GUILogHandler | None = None
+        self._log_pipe: tuple[int, int] | None = None
+        self._console_lines = 0
+
+        # Coalesces the port/stream-name write traces into one idle update
+        self._url_pending = False
 
         # State persistence
         self._state = AppState()
@@ -70,11 +209,14 @@ class StreamerGUI:
         png_path = icons_dir / "icon.png"
         icns_path = icons_dir / "rtsp_viewer.icns"
 
-        # Set window icon using PNG (works cross-platform)
+        # Set window icon using PNG (works cross-platform). The PhotoImage
+        # itself is per-window (it binds to a Tk interpreter), but the PNG
+        # decode is cached at module level.
         if png_path.exists():
             try:
-                icon_image = Image.open(png_path)
-                icon_photo = ImageTk.PhotoImage(icon_image)
+                from PIL import ImageTk
+
+                icon_photo = ImageTk.PhotoImage(_load_icon_image(png_path))
                 self.root.iconphoto(True, icon_photo)
                 self._icon_photo = icon_photo  # Keep reference to prevent GC
             except Exception:
@@ -155,7 +297,8 @@ class StreamerGUI:
         backend_frame.pack(fill=tk.X, padx=10, pady=5)
 
         ttk.Label(backend_frame, text="Backend:").pack(side=tk.LEFT)
-        default_backend = "gstreamer" if GstRTSPStreamer.is_available() else "ffmpeg"
+        gst_ok = all(self._backend_caps["gstreamer"].values())
+        default_backend = "gstreamer" if gst_ok else "ffmpeg"
         self.backend_var = tk.StringVar(value=default_backend)
         self.backend_combo = ttk.Combobox(
             backend_frame,
@@ -301,33 +444,66 @@ class StreamerGUI:
 
     def _setup_log_handler(self) -> None:
         """Set up the log handler for GUI console."""
+        # On Unix a self-pipe plus createfilehandler lets Tk sleep until a
+        # message actually arrives instead of polling ten times a second;
+        # the writer pokes one wake byte per burst. Windows Tk has no
+        # createfilehandler, so fall back to the 100 ms polling loop there.
+        if hasattr(self.root.tk, "createfilehandler"):
+            try:
+                self._log_pipe = os.pipe()
+                os.set_blocking(self._log_pipe[1], False)
+                self.root.tk.createfilehandler(
+                    self._log_pipe[0], tk.READABLE, self._drain_log
+                )
+            except (OSError, tk.TclError):
+                self._log_pipe = None
+
+        pipe = self._log_pipe
+
         def log_callback(msg: str) -> None:
-            self._log_queue.put(msg)
+            with self._log_lock:
+                self._log_buffer.append(msg)
+                first = len(self._log_buffer) == 1
+            if pipe is not None and first:
+                try:
+                    os.write(pipe[1], b"\x00")
+                except OSError:
+                    pass  # wake already pending; drain will pick this up
 
         self._log_handler = add_gui_handler(log_callback)
-        self._process_log_queue()
+        if pipe is None:
+            self._process_log_queue()
+
+    def _drain_log(self, fd: int, mask: int) -> None:
+        """Flush buffered log messages when the self-pipe wakes Tk."""
+        os.read(fd, 4096)
+        with self._log_lock:
+            batch, self._log_buffer = self._log_buffer, []
+        if batch:
+            self._append_to_console(batch)
 
     def _process_log_queue(self) -> None:
-        """Process queued log messages and add them to the console."""
-        try:
-            while True:
-                msg = self._log_queue.get_nowait()
-                self._append_to_console(msg)
-        except queue.Empty:
-            pass
+        """Polling fallback for platforms without createfilehandler."""
+        with self._log_lock:
+            batch, self._log_buffer = self._log_buffer, []
+        if batch:
+            self._append_to_console(batch)
 
         # Schedule next check
         self.root.after(100, self._process_log_queue)
 
-    def _append_to_console(self, msg: str) -> None:
-        """Append a message to the console text widget."""
+    def _append_to_console(self, messages: list[str]) -> None:
+        """Append a batch of messages to the console text widget."""
         self.console_text.configure(state=tk.NORMAL)
-        self.console_text.insert(tk.END, msg + "\n")
+        self.console_text.insert(tk.END, "\n".join(messages) + "\n")
+        self._console_lines += len(messages)
 
-        # Limit to 1000 lines
-        line_count = int(self.console_text.index("end-1c").split(".")[0])
-        if line_count > 1000:
-            self.console_text.delete("1.0", f"{line_count - 1000}.0")
+        # Keep roughly 1000 lines, trimming in chunks so the delete runs
+        # once every ~100 messages instead of on every append
+        if self._console_lines > 1000:
+            trim = self._console_lines - 900
+            self.console_text.delete("1.0", f"{trim + 1}.0")
+            self._console_lines -= trim
 
         self.console_text.see(tk.END)
         self.console_text.configure(state=tk.DISABLED)
@@ -337,20 +513,22 @@ class StreamerGUI:
         self.console_text.configure(state=tk.NORMAL)
         self.console_text.delete("1.0", tk.END)
         self.console_text.configure(state=tk.DISABLED)
+        self._console_lines = 0
 
     def _setup_bindings(self) -> None:
         """Set up keyboard and event bindings."""
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.preview_canvas.bind("<Configure>", self._on_canvas_resize)
+        self.preview_canvas.bind("<Map>", self._on_canvas_mapped)
 
     def _check_dependencies(self) -> None:
         """Check if required dependencies are available."""
         # Check ffmpeg backend
-        ffmpeg_deps = RTSPStreamer.check_dependencies()
+        ffmpeg_deps = self._backend_caps["ffmpeg"]
         ffmpeg_ok = all(ffmpeg_deps.values())
 
         # Check GStreamer backend
-        gst_deps = GstRTSPStreamer.check_dependencies()
+        gst_deps = self._backend_caps["gstreamer"]
         gst_ok = all(gst_deps.values())
 
         if gst_ok:
@@ -377,16 +555,16 @@ class StreamerGUI:
         """Update the backend availability status display."""
         backend = self.backend_var.get()
 
+        deps = self._backend_caps[backend]
         if backend == "gstreamer":
-            if GstRTSPStreamer.is_available():
+            if all(deps.values()):
                 self.backend_status.config(text="(available - recommended)", foreground="green")
             else:
                 self.backend_status.config(text="(not installed)", foreground="red")
         else:  # ffmpeg
-            if RTSPStreamer.is_available():
+            if all(deps.values()):
                 self.backend_status.config(text="(available)", foreground="green")
             else:
-                deps = RTSPStreamer.check_dependencies()
                 missing = [k for k, v in deps.items() if not v]
                 msg = f"(missing: {', '.join(missing)})"
                 self.backend_status.config(text=msg, foreground="red")
@@ -415,7 +593,15 @@ class StreamerGUI:
                 self._start_preview()
 
     def _update_url(self, *args) -> None:
-        """Update the displayed RTSP URL."""
+        """Schedule a URL refresh; coalesces per-keystroke trace callbacks."""
+        if self._url_pending:
+            return
+        self._url_pending = True
+        self.root.after_idle(self._apply_url)
+
+    def _apply_url(self) -> None:
+        """Recompute the displayed RTSP URL."""
+        self._url_pending = False
         try:
             port = int(self.port_var.get())
         except ValueError:
@@ -439,13 +625,13 @@ class StreamerGUI:
         backend = self.backend_var.get()
 
         # Check if selected backend is available
+        deps = self._backend_caps[backend]
         if backend == "gstreamer":
-            if not GstRTSPStreamer.is_available():
+            if not all(deps.values()):
                 self._update_status("GStreamer not available - run: make install-gstreamer")
                 return
         else:  # ffmpeg
-            if not RTSPStreamer.is_available():
-                deps = RTSPStreamer.check_dependencies()
+            if not all(deps.values()):
                 missing = [k for k, v in deps.items() if not v]
                 self._update_status(f"FFmpeg backend missing: {', '.join(missing)}")
                 return
@@ -545,106 +731,261 @@ class StreamerGUI:
         if self._preview_running or not self._video_path:
             return
 
-        self._preview_cap = cv2.VideoCapture(str(self._video_path))
-        if not self._preview_cap.isOpened():
-            log.error(f"Could not open video: {self._video_path}")
-            return
+        import cv2
+
+        # Prefer PyAV on macOS for VideoToolbox hardware decode; cv2's
+        # default backend there decodes H.264/H.265 on the CPU
+        if sys.platform == "darwin":
+            self._preview_cap = _PyAVPreview(str(self._video_path))
 
+        if self._preview_cap is None or not self._preview_cap.isOpened():
+            self._preview_cap = cv2.VideoCapture(str(self._video_path))
+            if not self._preview_cap.isOpened():
+                log.error(f"Could not open video: {self._video_path}")
+                self._preview_cap = None
+                return
+            # Keep at most one decoded frame buffered behind the reader; the
+            # default queue wastes several frames' worth of RAM on a preview.
+            self._preview_cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Decode only frames the ~15 fps preview will actually show;
+        # intermediate frames are skipped with grab() in the worker.
+        src_fps = self._preview_cap.get(cv2.CAP_PROP_FPS)
+        self._preview_skip = max(0, round(src_fps / 15) - 1) if src_fps > 0 else 0
+
+        self._layout_cache = None
+        self._preview_stop = threading.Event()
+        self._preview_visible = threading.Event()
+        self._preview_visible.set()
+        self._preview_queue = queue.Queue(maxsize=1)
         self._preview_running = True
+        self._preview_thread = threading.Thread(
+            target=self._preview_worker, daemon=True, name="preview-decode"
+        )
+        self._preview_thread.start()
         self._update_preview_frame()
         log.info("Preview started")
 
     def _stop_preview(self) -> None:
         """Stop video preview."""
         self._preview_running = False
+        self._preview_stop.set()
+        if self._preview_thread is not None:
+            self._preview_thread.join(timeout=1.0)
+            self._preview_thread = None
         if self._preview_cap:
             self._preview_cap.release()
             self._preview_cap = None
         self._show_placeholder()
         log.info("Preview stopped")
 
-    def _update_preview_frame(self) -> None:
-        """Update the preview display with the next frame."""
-        if not self._preview_running or not self._preview_cap:
-            return
+    def _preview_worker(self) -> None:
+        """Decode, resize and convert preview frames off the Tk thread.
 
-        ret, frame = self._preview_cap.read()
-        if not ret:
-            # Loop back to start
-            self._preview_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, frame = self._preview_cap.read()
+        The Tk side only pastes finished RGB frames, so heavy cv2 work on
+        large videos never stalls event handling. A 1-slot queue with
+        drop-oldest keeps the display on the freshest frame.
+        """
+        import cv2
+
+        cap = self._preview_cap
+        stop = self._preview_stop
+        visible = self._preview_visible
+        out = self._preview_queue
+
+        while cap is not None and not stop.is_set():
+            if not visible.is_set():
+                # Keep the stream position moving but skip all pixel work
+                # while nobody can see the canvas
+                cap.grab()
+                stop.wait(0.5)
+                continue
+
+            # Advance with grab() (no BGR conversion or numpy copy) past
+            # frames the preview would never show, then retrieve only the
+            # one displayed.
+            for _ in range(self._preview_skip + 1):
+                if not cap.grab():
+                    # Loop back to start
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    if not cap.grab():
+                        return
+            ret, frame = cap.retrieve()
             if not ret:
-                self._stop_preview()
                 return
 
-        self._display_frame(frame)
-
-        # Schedule next update (~15 fps for preview)
-        self.root.after(66, self._update_preview_frame)
-
-    def _display_frame(self, frame: np.ndarray) -> None:
-        """Display a frame on the preview canvas."""
-        canvas_width = self.preview_canvas.winfo_width()
-        canvas_height = self.preview_canvas.winfo_height()
-
+            item = self._prepare_preview(frame)
+            if item is not None:
+                # Drop the stale frame rather than block the decoder
+                try:
+                    out.get_nowait()
+                except queue.Empty:
+                    pass
+                out.put(item)
+
+            stop.wait(1 / 15)
+
+    def _prepare_preview(
+        self, frame: "np.ndarray"
+    ) -> "tuple[Image.Image, int, int, tuple[int, int]] | None":
+        """Resize and convert a frame for display. Runs on the worker thread."""
+        import cv2
+        import numpy as np
+
+        canvas_width, canvas_height = self._canvas_size
         if canvas_width <= 1 or canvas_height <= 1:
-            return
+            return None
 
-        # Calculate aspect ratio
         frame_height, frame_width = frame.shape[:2]
-        frame_aspect = frame_width / frame_height
-        canvas_aspect = canvas_width / canvas_height
 
-        # Calculate display size maintaining aspect ratio
-        if frame_aspect > canvas_aspect:
-            display_width = canvas_width
-            display_height = int(canvas_width / frame_aspect)
+        # Frame and canvas sizes rarely change between ticks, so cache the
+        # aspect-correct layout rather than redoing the float math per frame.
+        # Integer math only: a/b > c/d  <=>  a*d > c*b for positive sizes.
+        key = (frame_width, frame_height, canvas_width, canvas_height)
+        if self._layout_cache is not None and self._layout_cache[0] == key:
+            _, display_width, display_height, x, y = self._layout_cache
         else:
-            display_height = canvas_height
-            display_width = int(canvas_height * frame_aspect)
+            if frame_width * canvas_height > canvas_width * frame_height:
+                display_width = canvas_width
+                display_height = canvas_width * frame_height // frame_width
+            else:
+                display_height = canvas_height
+                display_width = canvas_height * frame_width // frame_height
+            x = (canvas_width - display_width) // 2
+            y = (canvas_height - display_height) // 2
+            self._layout_cache = (key, display_width, display_height, x, y)
+
+        # All per-frame storage is preallocated per display size; a 1080p
+        # frame would otherwise hand the allocator ~12 MB of transients per
+        # tick. Output slots are RGBA because PIL's frombuffer shares (not
+        # copies) RGBA memory, so each slot's Image is built once here and
+        # keeps reading the live buffer on every paste.
+        if (
+            self._resize_buf is None
+            or self._resize_buf.shape[:2] != (display_height, display_width)
+        ):
+            from PIL import Image
+
+            size = (display_width, display_height)
+            self._resize_buf = np.empty((display_height, display_width, 3), np.uint8)
+            self._rgb_bufs = [
+                np.empty((display_height, display_width, 4), np.uint8)
+                for _ in self._rgb_bufs
+            ]
+            self._pil_images = [
+                Image.frombuffer("RGBA", size, buf, "raw", "RGBA", 0, 1)
+                for buf in self._rgb_bufs
+            ]
+
+        # INTER_AREA for downscaling quality, INTER_LINEAR for upscale speed
+        interpolation = cv2.INTER_AREA if display_width < frame_width else cv2.INTER_LINEAR
+        cv2.resize(
+            frame, (display_width, display_height),
+            dst=self._resize_buf, interpolation=interpolation,
+        )
+        rgb_buf = self._rgb_bufs[self._rgb_index]
+        image = self._pil_images[self._rgb_index]
+        self._rgb_index = (self._rgb_index + 1) % len(self._rgb_bufs)
+        cv2.cvtColor(self._resize_buf, cv2.COLOR_BGR2RGBA, dst=rgb_buf)
 
-        # Resize frame
-        if display_width < frame_width:
-            resized = cv2.resize(
-                frame, (display_width, display_height), interpolation=cv2.INTER_AREA
-            )
-        else:
-            resized = cv2.resize(
-                frame, (display_width, display_height), interpolation=cv2.INTER_LINEAR
-            )
+        return image, x, y, (display_width, display_height)
 
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+    def _update_preview_frame(self) -> None:
+        """Paste the latest worker-prepared frame onto the canvas."""
+        if not self._preview_running:
+            return
+
+        if self._preview_thread is not None and not self._preview_thread.is_alive():
+            # Worker hit an unrecoverable decode error
+            self._stop_preview()
+            return
+
+        # Skip painting entirely while nobody can see the canvas (minimized
+        # or unmapped); poll for visibility at a low rate. <Map> resumes the
+        # normal cadence.
+        try:
+            visible = self.root.state() != "iconic" and self.preview_canvas.winfo_viewable()
+        except tk.TclError:
+            visible = False
+        if not visible:
+            self._preview_visible.clear()
+            self._preview_after_id = self.root.after(500, self._update_preview_frame)
+            return
+        self._preview_visible.set()
 
-        # Convert to PIL Image
-        image = Image.fromarray(rgb_frame)
+        try:
+            image, x, y, size = self._preview_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            from PIL import ImageTk
+
+            # Reuse one PhotoImage and canvas item across frames; allocating
+            # a fresh pixmap per tick is the main cost of the naive Tk video
+            # loop.
+            if self._photo is None or self._photo_size != size or self._canvas_image_id is None:
+                self._photo = ImageTk.PhotoImage(image=image)
+                self._photo_size = size
+                # Hide rather than delete: recreating items makes Tk
+                # rebuild its display list on every size change
+                self.preview_canvas.itemconfigure("placeholder", state="hidden")
+                self.preview_canvas.delete("video")
+                self._canvas_image_id = self.preview_canvas.create_image(
+                    x, y, anchor=tk.NW, image=self._photo, tags="video"
+                )
+            else:
+                self._photo.paste(image)
+                self.preview_canvas.coords(self._canvas_image_id, x, y)
 
-        # Convert to PhotoImage
-        self._photo = ImageTk.PhotoImage(image=image)
+        self._preview_after_id = self.root.after(33, self._update_preview_frame)
 
-        # Display on canvas
-        self.preview_canvas.delete("all")
-        x = (canvas_width - display_width) // 2
-        y = (canvas_height - display_height) // 2
-        self.preview_canvas.create_image(x, y, anchor=tk.NW, image=self._photo)
+    def _on_canvas_mapped(self, event: tk.Event) -> None:
+        """Resume the normal preview cadence as soon as the canvas reappears."""
+        if self._preview_running and self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+            self._update_preview_frame()
 
     def _show_placeholder(self) -> None:
         """Show the placeholder text on the canvas."""
-        self.preview_canvas.delete("all")
+        self._canvas_image_id = None
+        self._photo_size = None
         width = self.preview_canvas.winfo_width()
         height = self.preview_canvas.winfo_height()
-        self.preview_canvas.create_text(
-            width // 2,
-            height // 2,
-            text="No video loaded\nSelect a video file to preview",
-            fill="white",
-            font=("Arial", 12),
-            justify=tk.CENTER,
-            tags="placeholder",
-        )
+        # Toggle visibility by tag instead of delete("all") so the video
+        # item survives pause/resume and keeps Tk item churn at zero
+        self.preview_canvas.itemconfigure("video", state="hidden")
+        if self.preview_canvas.find_withtag("placeholder"):
+            self.preview_canvas.coords("placeholder", width // 2, height // 2)
+            self.preview_canvas.itemconfigure("placeholder", state="normal")
+        else:
+            self.preview_canvas.create_text(
+                width // 2,
+                height // 2,
+                text="No video loaded\nSelect a video file to preview",
+                fill="white",
+                font=("Arial", 12),
+                justify=tk.CENTER,
+                tags="placeholder",
+            )
 
     def _on_canvas_resize(self, event: tk.Event) -> None:
-        """Handle canvas resize."""
+        """Debounce canvas resizes; Tk fires <Configure> per pixel of a drag.
+
+        Only the settled size is committed, so a window drag causes one
+        layout invalidation and buffer reallocation instead of dozens.
+        """
+        self._pending_canvas_size = (event.width, event.height)
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(80, self._commit_canvas_resize)
+
+    def _commit_canvas_resize(self) -> None:
+        """Apply the final canvas size once the resize stream settles."""
+        self._resize_after_id = None
+        # Cached here so the preview worker never has to touch Tk
+        self._canvas_size = self._pending_canvas_size
+        self._layout_cache = None
         if not self._preview_running:
             self._show_placeholder()
 
@@ -701,6 +1042,16 @@ class StreamerGUI:
             remove_gui_handler(self._log_handler)
             self._log_handler = None
 
+        # Tear down the self-pipe wake channel
+        if self._log_pipe is not None:
+            try:
+                self.root.tk.deletefilehandler(self._log_pipe[0])
+            except tk.TclError:
+                pass
+            os.close(self._log_pipe[0])
+            os.close(self._log_pipe[1])
+            self._log_pipe = None
+
         self.root.destroy()
 
     def run(self) -> None:
@@ -1,10 +1,21 @@
 """State persistence for RTSP Viewer."""
 
 import json
+import mmap
+import os
+import threading
+import time
 from pathlib import Path
 
 from rtsp_viewer.utils.logger import get_logger
 
+# orjson serializes typical state dicts several times faster than the
+# stdlib encoder; fall back to json when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = get_logger("state")
 
 DEFAULT_STATE_FILE = Path.home() / ".config" / "rtsp_viewer" / "state.json"
@@ -13,28 +24,66 @@ DEFAULT_STATE_FILE = Path.home() / ".config" / "rtsp_viewer" / "state.json"
 class AppState:
     """Manages persistent application state."""
 
+    # How long to let a burst of set() calls settle before writing
+    SAVE_DELAY = 2.0
+
     def __init__(self, state_file: Path = DEFAULT_STATE_FILE):
         self.state_file = state_file
         self._state: dict = {}
+        self._saved_state: dict = {}
+        self._dirty = threading.Event()
         self._load()
 
+        # Background writer: set() marks dirty and this thread batches a
+        # burst of changes into one serialize + disk write
+        self._saver_thread = threading.Thread(
+            target=self._save_loop, daemon=True, name="state-saver"
+        )
+        self._saver_thread.start()
+
     def _load(self) -> None:
         """Load state from file."""
         if self.state_file.exists():
             try:
-                self._state = json.loads(self.state_file.read_text())
+                # Large state files parse straight out of the page cache
+                # via mmap instead of materializing an intermediate string;
+                # small ones aren't worth the extra syscalls
+                if self.state_file.stat().st_size > 64 * 1024:
+                    with open(self.state_file, "rb") as f:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            if orjson is not None:
+                                self._state = orjson.loads(memoryview(mm))
+                            else:
+                                self._state = json.loads(mm[:])
+                else:
+                    data = self.state_file.read_bytes()
+                    self._state = orjson.loads(data) if orjson is not None else json.loads(data)
                 log.debug(f"Loaded state from {self.state_file}")
             except Exception as e:
                 log.warning(f"Failed to load state: {e}")
                 self._state = {}
         else:
             self._state = {}
+        # Snapshot of what is on disk, so unchanged saves can be skipped
+        self._saved_state = dict(self._state)
 
     def save(self) -> None:
         """Save state to file."""
+        if self._state == self._saved_state:
+            log.debug("State unchanged, skipping save")
+            return
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            self.state_file.write_text(json.dumps(self._state, indent=2))
+            if orjson is not None:
+                data = orjson.dumps(self._state, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self._state, indent=2).encode("utf-8")
+            # Write-then-rename so a crash mid-write can't corrupt the
+            # existing state file
+            tmp_file = self.state_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.state_file)
+            self._saved_state = dict(self._state)
             log.debug(f"Saved state to {self.state_file}")
         except Exception as e:
             log.warning(f"Failed to save state: {e}")
@@ -44,77 +93,48 @@ class AppState:
         return self._state.get(key, default)
 
     def set(self, key: str, value) -> None:
-        """Set a state value."""
+        """Set a state value and schedule a debounced save."""
         self._state[key] = value
-
-    # Convenience properties for common settings
-    @property
-    def last_camera(self) -> str | None:
-        """Get the last selected camera name."""
-        return self.get("last_camera")
-
-    @last_camera.setter
-    def last_camera(self, name: str) -> None:
-        """Set the last selected camera name."""
-        self.set("last_camera", name)
-
-    @property
-    def audio_preview_enabled(self) -> bool:
-        """Get audio preview preference."""
-        return self.get("audio_preview_enabled", True)
-
-    @audio_preview_enabled.setter
-    def audio_preview_enabled(self, enabled: bool) -> None:
-        """Set audio preview preference."""
-        self.set("audio_preview_enabled", enabled)
-
-    @property
-    def record_audio_enabled(self) -> bool:
-        """Get record audio preference."""
-        return self.get("record_audio_enabled", True)
-
-    @record_audio_enabled.setter
-    def record_audio_enabled(self, enabled: bool) -> None:
-        """Set record audio preference."""
-        self.set("record_audio_enabled", enabled)
-
-    @property
-    def console_visible(self) -> bool:
-        """Get console visibility preference."""
-        return self.get("console_visible", False)
-
-    @console_visible.setter
-    def console_visible(self, visible: bool) -> None:
-        """Set console visibility preference."""
-        self.set("console_visible", visible)
-
-    # Streamer GUI settings
-    @property
-    def streamer_last_video(self) -> str | None:
-        """Get the last selected video file path for streamer."""
-        return self.get("streamer_last_video")
-
-    @streamer_last_video.setter
-    def streamer_last_video(self, path: str | None) -> None:
-        """Set the last selected video file path for streamer."""
-        self.set("streamer_last_video", path)
-
-    @property
-    def streamer_show_preview(self) -> bool:
-        """Get streamer preview preference."""
-        return self.get("streamer_show_preview", True)
-
-    @streamer_show_preview.setter
-    def streamer_show_preview(self, enabled: bool) -> None:
-        """Set streamer preview preference."""
-        self.set("streamer_show_preview", enabled)
-
-    @property
-    def streamer_audio_enabled(self) -> bool:
-        """Get streamer audio preference."""
-        return self.get("streamer_audio_enabled", True)
-
-    @streamer_audio_enabled.setter
-    def streamer_audio_enabled(self, enabled: bool) -> None:
-        """Set streamer audio preference."""
-        self.set("streamer_audio_enabled", enabled)
+        self._dirty.set()
+
+    def flush(self) -> None:
+        """Write any pending changes synchronously (for shutdown paths)."""
+        self._dirty.clear()
+        self.save()
+
+    def _save_loop(self) -> None:
+        """Debounced background writer."""
+        while True:
+            self._dirty.wait()
+            time.sleep(self.SAVE_DELAY)
+            self._dirty.clear()
+            self.save()
+
+    # Known settings and their defaults. Reads and writes go through
+    # __getattr__/__setattr__ below instead of a property pair per setting:
+    # one dict lookup per access, and adding a setting is one line here.
+    _SCHEMA: dict = {
+        "last_camera": None,
+        "audio_preview_enabled": True,
+        "record_audio_enabled": True,
+        "console_visible": False,
+        # Streamer GUI settings
+        "streamer_last_video": None,
+        "streamer_show_preview": True,
+        "streamer_audio_enabled": True,
+    }
+
+    def __getattr__(self, name: str):
+        """Resolve schema settings from the state dict."""
+        try:
+            default = type(self)._SCHEMA[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return self._state.get(name, default)
+
+    def __setattr__(self, name: str, value) -> None:
+        """Route schema settings through set(); everything else is normal."""
+        if name in type(self)._SCHEMA:
+            self.set(name, value)
+        else:
+            object.__setattr__(self, name, value)